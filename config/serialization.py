@@ -0,0 +1,38 @@
+from datetime import datetime
+import msgpack
+from kombu.serialization import register
+
+# msgpack task serializer that keeps encoded review vectors as raw bytes and
+# round-trips the datetimes produced by the scraper
+SERIALIZER_NAME = "reviews-msgpack"
+
+_DATETIME_EXT = 1
+
+
+def _default(obj):
+    if isinstance(obj, datetime):
+        return msgpack.ExtType(_DATETIME_EXT, obj.isoformat().encode("ascii"))
+    raise TypeError(f"Cannot serialize {type(obj).__name__} with {SERIALIZER_NAME}")
+
+
+def _ext_hook(code, data):
+    if code == _DATETIME_EXT:
+        return datetime.fromisoformat(data.decode("ascii"))
+    return msgpack.ExtType(code, data)
+
+
+def dumps(payload):
+    return msgpack.packb(payload, use_bin_type=True, default=_default)
+
+
+def loads(payload):
+    return msgpack.unpackb(payload, raw=False, ext_hook=_ext_hook)
+
+
+register(
+    SERIALIZER_NAME,
+    dumps,
+    loads,
+    content_type="application/x-reviews-msgpack",
+    content_encoding="binary",
+)
@@ -15,7 +15,7 @@ from ariadne import (
 )
 from ariadne.explorer.playground import PLAYGROUND_HTML
 
-from inference_service.client.inference_client import InferenceClient
+from inference_service.client.pool import get_client
 from inference_service.utils.logging_utils import setup_logging
 
 # ----- resolvers -----
@@ -29,10 +29,14 @@ def resolve_hello(_, info):
 
 @query.field("predict")
 def resolve_predict(_, info, text):
-    # initialize gRPC client
-    client = InferenceClient(
+    # reuse a pooled gRPC client, calls are bounded by a deadline
+    hedge_delay_ms = float(os.getenv("GRPC_INFERENCE_HEDGE_DELAY_MS", "0"))
+    client = get_client(
         host=os.getenv("GRPC_INFERENCE_HOST", "localhost"),
         port=int(os.getenv("GRPC_INFERENCE_PORT", "50051")),
+        size=int(os.getenv("GRPC_INFERENCE_POOL_SIZE", "2")),
+        timeout=float(os.getenv("GRPC_INFERENCE_TIMEOUT", "5")),
+        hedge_delay=hedge_delay_ms / 1000 if hedge_delay_ms else None,
     )
     if not client.check_health():
         # service down → return null
@@ -1,4 +1,6 @@
 import grpc
+import json
+import queue
 import logging
 import argparse
 from inference_service.proto import inference_pb2
@@ -6,31 +8,159 @@ from inference_service.proto import inference_pb2_grpc
 from inference_service.utils.logging_utils import setup_logging
 
 
+def channel_options(
+    keepalive_ms=30000,
+    keepalive_timeout_ms=10000,
+    max_attempts=3,
+    retryable_codes=("UNAVAILABLE",),
+):
+    """gRPC channel options enabling keepalive and a transparent retry policy"""
+    service_config = {
+        "methodConfig": [
+            {
+                "name": [{"service": "inference.InferenceService"}],
+                "retryPolicy": {
+                    "maxAttempts": max_attempts,
+                    "initialBackoff": "0.1s",
+                    "maxBackoff": "1s",
+                    "backoffMultiplier": 2,
+                    "retryableStatusCodes": list(retryable_codes),
+                },
+            }
+        ]
+    }
+    return [
+        ("grpc.keepalive_time_ms", keepalive_ms),
+        ("grpc.keepalive_timeout_ms", keepalive_timeout_ms),
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+        ("grpc.enable_retries", 1),
+        ("grpc.service_config", json.dumps(service_config)),
+    ]
+
+
 class InferenceClient:
-    def __init__(self, host="localhost", port=50051):
+    """Client for the inference service.
+
+    ``timeout`` is the per-call deadline in seconds. With ``hedge_delay`` set,
+    a Predict call that has not answered after that many seconds is sent a
+    second time and the first response wins.
+    """
+
+    def __init__(
+        self, host="localhost", port=50051, timeout=None, hedge_delay=None, options=None
+    ):
         self.logger = logging.getLogger(__name__)
-        self.channel = grpc.insecure_channel(f"{host}:{port}")
+        self.timeout = timeout
+        self.hedge_delay = hedge_delay
+        self.channel = grpc.insecure_channel(
+            f"{host}:{port}",
+            options=channel_options() if options is None else options,
+        )
         self.stub = inference_pb2_grpc.InferenceServiceStub(self.channel)
         self.logger.info(f"Client initialized, connecting to {host}:{port}")
 
+    def close(self):
+        self.channel.close()
+
+    def _hedged(self, method, request):
+        """Call ``method``, re-issuing the request if it is slower than hedge_delay"""
+        if not self.hedge_delay:
+            return method(request, timeout=self.timeout)
+
+        first = method.future(request, timeout=self.timeout)
+        try:
+            return first.result(timeout=self.hedge_delay)
+        except grpc.FutureTimeoutError:
+            self.logger.info("Hedging slow request")
+
+        second = method.future(request, timeout=self.timeout)
+        calls = (first, second)
+        done = queue.Queue()
+        for call in calls:
+            call.add_done_callback(done.put)
+
+        error = None
+        try:
+            for _ in calls:
+                try:
+                    return done.get().result()
+                except grpc.RpcError as e:
+                    error = e
+            raise error
+        finally:
+            for call in calls:
+                call.cancel()
+
     def predict(self, text):
         self.logger.info(f"Sending prediction request: {text[:50]}...")
         request = inference_pb2.PredictRequest(text=text)
 
         try:
-            response = self.stub.Predict(request)
+            response = self._hedged(self.stub.Predict, request)
             self.logger.info(f"Received prediction: {response.rating}")
             return response
         except grpc.RpcError as e:
             self.logger.error(f"RPC error: {e.code()}, {e.details()}")
             return None
 
-    def check_health(self):
+    def predict_many(self, texts, batch_size=256):
+        """Predict a list of texts using PredictBatch calls of ``batch_size``"""
+        texts = list(texts)
+        self.logger.info(f"Sending batch prediction request: {len(texts)} texts")
+        results = []
+
+        try:
+            for start in range(0, len(texts), batch_size):
+                request = inference_pb2.PredictBatchRequest(
+                    texts=texts[start : start + batch_size]
+                )
+                response = self.stub.PredictBatch(request, timeout=self.timeout)
+                results.extend(response.results)
+            self.logger.info(f"Received {len(results)} predictions")
+            return results
+        except grpc.RpcError as e:
+            self.logger.error(f"RPC error: {e.code()}, {e.details()}")
+            return None
+
+    def predict_stream(self, texts):
+        """Stream texts to the server, yielding responses in input order"""
+        requests = (inference_pb2.PredictRequest(text=text) for text in texts)
+
+        try:
+            for response in self.stub.PredictStream(requests):
+                yield response
+        except grpc.RpcError as e:
+            self.logger.error(f"RPC error: {e.code()}, {e.details()}")
+            raise
+
+    def reload_model(self, version=""):
+        """Ask the server to hot-swap to ``version`` (latest when empty)"""
+        self.logger.info(f"Requesting model reload: {version or 'latest'}")
+        request = inference_pb2.ReloadModelRequest(version=version)
+
+        try:
+            response = self.stub.ReloadModel(request)
+            self.logger.info(
+                f"Model version {response.previous_version} -> {response.model_version}"
+            )
+            return response
+        except grpc.RpcError as e:
+            self.logger.error(f"RPC error: {e.code()}, {e.details()}")
+            return None
+
+    def check_health(self, liveness=False):
+        """Return True if the service is ready (or merely alive with ``liveness``)"""
         self.logger.info("Checking service health...")
-        request = inference_pb2.HealthRequest()
+        probe = (
+            inference_pb2.HealthRequest.Probe.LIVENESS
+            if liveness
+            else inference_pb2.HealthRequest.Probe.READINESS
+        )
+        request = inference_pb2.HealthRequest(probe=probe)
 
         try:
-            response = self.stub.Health(request)
+            response = self.stub.Health(request, timeout=self.timeout)
             status = (
                 "SERVING"
                 if response.status == inference_pb2.HealthResponse.Status.SERVING
@@ -65,6 +195,7 @@ def main():
         print(f"Prediction: {response.prediction}")
         print(f"Confidence: {response.confidence:.4f}")
         print(f"Rating: {response.rating}")
+        print(f"Model version: {response.model_version}")
 
 
 if __name__ == "__main__":
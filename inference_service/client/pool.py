@@ -0,0 +1,56 @@
+import threading
+import itertools
+
+from inference_service.client.inference_client import InferenceClient
+
+
+class InferenceClientPool:
+    """Process-wide pool of long-lived InferenceClients.
+
+    Each target gets ``size`` clients (one channel each) created on first use
+    and handed out round-robin, so callers never pay for a new connection.
+    """
+
+    def __init__(self, size=2, **client_kwargs):
+        self.size = max(1, int(size))
+        self.client_kwargs = client_kwargs
+        self._clients = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def get(self, host="localhost", port=50051):
+        key = (host, int(port))
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = [
+                    InferenceClient(host, int(port), **self.client_kwargs)
+                    for _ in range(self.size)
+                ]
+                self._counters[key] = itertools.count()
+            clients = self._clients[key]
+            return clients[next(self._counters[key]) % len(clients)]
+
+    def close(self):
+        with self._lock:
+            for clients in self._clients.values():
+                for client in clients:
+                    client.close()
+            self._clients.clear()
+            self._counters.clear()
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_client(host="localhost", port=50051, **pool_kwargs):
+    """Return a pooled client for ``host:port`` from the process-wide pool.
+
+    ``pool_kwargs`` (``size``, ``timeout``, ``hedge_delay``...) only take effect
+    when the pool is first created.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = InferenceClientPool(**pool_kwargs)
+    return _default_pool.get(host, port)
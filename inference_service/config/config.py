@@ -7,14 +7,61 @@ class ModelConfig:
         self.BERT_MODEL_PATH = os.environ.get(
             "BERT_MODEL_PATH", "allegro/herbert-base-cased"
         )
+        self.BERT_MODEL_REVISION = os.environ.get("BERT_MODEL_REVISION", "main")
+        self.ONNX_MODEL_PATH = os.environ.get(
+            "ONNX_MODEL_PATH", "models/herbert-base-cased/model.onnx"
+        )
+
+        # Encoder backend: "torch", "torch-int8", "onnx" or "onnx-int8"
+        self.ENCODER_BACKEND = os.environ.get("ENCODER_BACKEND", "torch")
+        self.ENCODER_THREADS = int(os.environ.get("ENCODER_THREADS", 0))
+        self.ENCODER_PARITY_CHECK = (
+            os.environ.get("ENCODER_PARITY_CHECK", "false").lower() == "true"
+        )
+        self.ENCODER_MIN_COSINE = float(os.environ.get("ENCODER_MIN_COSINE", 0.99))
         self.SPARK_MODEL_PATH = os.environ.get(
             "SPARK_MODEL_PATH",
             "spark/models/review_classification_model/review_classification_model",
         )
+        self.TREE_ENSEMBLE_PATH = os.environ.get(
+            "TREE_ENSEMBLE_PATH",
+            "spark/models/review_classification_model/review_classification_model.npz",
+        )
+
+        # Versioned classifier registry for hot reload, static paths above when unset
+        self.MODEL_REGISTRY_DIR = os.environ.get("MODEL_REGISTRY_DIR")
+        self.MODEL_WATCH_INTERVAL = float(os.environ.get("MODEL_WATCH_INTERVAL", 30))
+
+        # Classifier runtime: "numpy" (TreeEnsemble) or "spark" (PipelineModel,
+        # needs the "spark" extra)
+        self.CLASSIFIER_BACKEND = os.environ.get("CLASSIFIER_BACKEND", "numpy")
 
         # Server settings
         self.SERVER_PORT = int(os.environ.get("SERVER_PORT", 50051))
         self.MAX_WORKERS = int(os.environ.get("MAX_WORKERS", 10))
+        self.METRICS_PORT = int(os.environ.get("METRICS_PORT", 8000))
+
+        # Server mode: "thread" (grpc.server) or "aio" (grpc.aio with admission control)
+        self.SERVER_MODE = os.environ.get("SERVER_MODE", "thread")
+        self.MAX_IN_FLIGHT = int(os.environ.get("MAX_IN_FLIGHT", 32))
+        self.MAX_QUEUE_DEPTH = int(os.environ.get("MAX_QUEUE_DEPTH", 64))
+        # The threaded server only bounds concurrent RPCs when either limit is set
+        self.ADMISSION_CONTROL = "MAX_IN_FLIGHT" in os.environ or "MAX_QUEUE_DEPTH" in os.environ
+        self.RETRY_AFTER_MS = int(os.environ.get("RETRY_AFTER_MS", 200))
+
+        # Micro-batching settings
+        self.BATCH_MAX_SIZE = int(os.environ.get("BATCH_MAX_SIZE", 16))
+        self.BATCH_MAX_WAIT_MS = float(os.environ.get("BATCH_MAX_WAIT_MS", 10))
+
+        # Health settings, periodic model self-test is disabled when set to 0
+        self.HEALTH_SELF_TEST_INTERVAL = float(
+            os.environ.get("HEALTH_SELF_TEST_INTERVAL", 0)
+        )
+
+        # Embedding cache settings (Redis tier is disabled when the URL is empty)
+        self.EMBEDDING_CACHE_SIZE = int(os.environ.get("EMBEDDING_CACHE_SIZE", 10000))
+        self.EMBEDDING_CACHE_REDIS_URL = os.environ.get("EMBEDDING_CACHE_REDIS_URL")
+        self.EMBEDDING_CACHE_TTL = int(os.environ.get("EMBEDDING_CACHE_TTL", 0))
 
         # Logging settings
         self.LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0finference.proto\x12\tinference\"\x1e\n\x0ePredictRequest\x12\x0c\n\x04text\x18\x01 \x01(\t\"I\n\x0fPredictResponse\x12\x12\n\nprediction\x18\x01 \x01(\t\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x0e\n\x06rating\x18\x03 \x01(\t\"\x0f\n\rHealthRequest\"w\n\x0eHealthResponse\x12\x30\n\x06status\x18\x01 \x01(\x0e\x32 .inference.HealthResponse.Status\"3\n\x06Status\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x0b\n\x07SERVING\x10\x01\x12\x0f\n\x0bNOT_SERVING\x10\x02\x32\x97\x01\n\x10InferenceService\x12\x42\n\x07Predict\x12\x19.inference.PredictRequest\x1a\x1a.inference.PredictResponse\"\x00\x12?\n\x06Health\x12\x18.inference.HealthRequest\x1a\x19.inference.HealthResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0finference.proto\x12\tinference\"\x1e\n\x0ePredictRequest\x12\x0c\n\x04text\x18\x01 \x01(\t\"`\n\x0fPredictResponse\x12\x12\n\nprediction\x18\x01 \x01(\t\x12\x12\n\nconfidence\x18\x02 \x01(\x02\x12\x0e\n\x06rating\x18\x03 \x01(\t\x12\x15\n\rmodel_version\x18\x04 \x01(\t\"$\n\x13PredictBatchRequest\x12\r\n\x05texts\x18\x01 \x03(\t\"C\n\x14PredictBatchResponse\x12+\n\x07results\x18\x01 \x03(\x0b\x32\x1a.inference.PredictResponse\"%\n\x12ReloadModelRequest\x12\x0f\n\x07version\x18\x01 \x01(\t\"F\n\x13ReloadModelResponse\x12\x15\n\rmodel_version\x18\x01 \x01(\t\x12\x18\n\x10previous_version\x18\x02 \x01(\t\"d\n\rHealthRequest\x12-\n\x05probe\x18\x01 \x01(\x0e\x32\x1e.inference.HealthRequest.Probe\"$\n\x05Probe\x12\r\n\tREADINESS\x10\x00\x12\x0c\n\x08LIVENESS\x10\x01\"w\n\x0eHealthResponse\x12\x30\n\x06status\x18\x01 \x01(\x0e\x32 .inference.HealthResponse.Status\"3\n\x06Status\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x0b\n\x07SERVING\x10\x01\x12\x0f\n\x0bNOT_SERVING\x10\x02\x32\x88\x03\n\x10InferenceService\x12\x42\n\x07Predict\x12\x19.inference.PredictRequest\x1a\x1a.inference.PredictResponse\"\x00\x12Q\n\x0cPredictBatch\x12\x1e.inference.PredictBatchRequest\x1a\x1f.inference.PredictBatchResponse\"\x00\x12L\n\rPredictStream\x12\x19.inference.PredictRequest\x1a\x1a.inference.PredictResponse\"\x00(\x01\x30\x01\x12N\n\x0bReloadModel\x12\x1d.inference.ReloadModelRequest\x1a\x1e.inference.ReloadModelResponse\"\x00\x12?\n\x06Health\x12\x18.inference.HealthRequest\x1a\x19.inference.HealthResponse\"\x00\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -34,13 +34,23 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_PREDICTREQUEST']._serialized_start=30
   _globals['_PREDICTREQUEST']._serialized_end=60
   _globals['_PREDICTRESPONSE']._serialized_start=62
-  _globals['_PREDICTRESPONSE']._serialized_end=135
-  _globals['_HEALTHREQUEST']._serialized_start=137
-  _globals['_HEALTHREQUEST']._serialized_end=152
-  _globals['_HEALTHRESPONSE']._serialized_start=154
-  _globals['_HEALTHRESPONSE']._serialized_end=273
-  _globals['_HEALTHRESPONSE_STATUS']._serialized_start=222
-  _globals['_HEALTHRESPONSE_STATUS']._serialized_end=273
-  _globals['_INFERENCESERVICE']._serialized_start=276
-  _globals['_INFERENCESERVICE']._serialized_end=427
+  _globals['_PREDICTRESPONSE']._serialized_end=158
+  _globals['_PREDICTBATCHREQUEST']._serialized_start=160
+  _globals['_PREDICTBATCHREQUEST']._serialized_end=196
+  _globals['_PREDICTBATCHRESPONSE']._serialized_start=198
+  _globals['_PREDICTBATCHRESPONSE']._serialized_end=265
+  _globals['_RELOADMODELREQUEST']._serialized_start=267
+  _globals['_RELOADMODELREQUEST']._serialized_end=304
+  _globals['_RELOADMODELRESPONSE']._serialized_start=306
+  _globals['_RELOADMODELRESPONSE']._serialized_end=376
+  _globals['_HEALTHREQUEST']._serialized_start=378
+  _globals['_HEALTHREQUEST']._serialized_end=478
+  _globals['_HEALTHREQUEST_PROBE']._serialized_start=442
+  _globals['_HEALTHREQUEST_PROBE']._serialized_end=478
+  _globals['_HEALTHRESPONSE']._serialized_start=480
+  _globals['_HEALTHRESPONSE']._serialized_end=599
+  _globals['_HEALTHRESPONSE_STATUS']._serialized_start=548
+  _globals['_HEALTHRESPONSE_STATUS']._serialized_end=599
+  _globals['_INFERENCESERVICE']._serialized_start=602
+  _globals['_INFERENCESERVICE']._serialized_end=994
 # @@protoc_insertion_point(module_scope)
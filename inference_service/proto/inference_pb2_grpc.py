@@ -39,6 +39,21 @@ class InferenceServiceStub(object):
                 request_serializer=inference__pb2.PredictRequest.SerializeToString,
                 response_deserializer=inference__pb2.PredictResponse.FromString,
                 _registered_method=True)
+        self.PredictBatch = channel.unary_unary(
+                '/inference.InferenceService/PredictBatch',
+                request_serializer=inference__pb2.PredictBatchRequest.SerializeToString,
+                response_deserializer=inference__pb2.PredictBatchResponse.FromString,
+                _registered_method=True)
+        self.PredictStream = channel.stream_stream(
+                '/inference.InferenceService/PredictStream',
+                request_serializer=inference__pb2.PredictRequest.SerializeToString,
+                response_deserializer=inference__pb2.PredictResponse.FromString,
+                _registered_method=True)
+        self.ReloadModel = channel.unary_unary(
+                '/inference.InferenceService/ReloadModel',
+                request_serializer=inference__pb2.ReloadModelRequest.SerializeToString,
+                response_deserializer=inference__pb2.ReloadModelResponse.FromString,
+                _registered_method=True)
         self.Health = channel.unary_unary(
                 '/inference.InferenceService/Health',
                 request_serializer=inference__pb2.HealthRequest.SerializeToString,
@@ -56,6 +71,27 @@ class InferenceServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def PredictBatch(self, request, context):
+        """Perform inference on many texts in a single call
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PredictStream(self, request_iterator, context):
+        """Perform inference on a stream of texts, responses follow request order
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ReloadModel(self, request, context):
+        """Load a classifier version from the model registry and swap it in
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def Health(self, request, context):
         """Get model health status
         """
@@ -71,6 +107,21 @@ def add_InferenceServiceServicer_to_server(servicer, server):
                     request_deserializer=inference__pb2.PredictRequest.FromString,
                     response_serializer=inference__pb2.PredictResponse.SerializeToString,
             ),
+            'PredictBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.PredictBatch,
+                    request_deserializer=inference__pb2.PredictBatchRequest.FromString,
+                    response_serializer=inference__pb2.PredictBatchResponse.SerializeToString,
+            ),
+            'PredictStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.PredictStream,
+                    request_deserializer=inference__pb2.PredictRequest.FromString,
+                    response_serializer=inference__pb2.PredictResponse.SerializeToString,
+            ),
+            'ReloadModel': grpc.unary_unary_rpc_method_handler(
+                    servicer.ReloadModel,
+                    request_deserializer=inference__pb2.ReloadModelRequest.FromString,
+                    response_serializer=inference__pb2.ReloadModelResponse.SerializeToString,
+            ),
             'Health': grpc.unary_unary_rpc_method_handler(
                     servicer.Health,
                     request_deserializer=inference__pb2.HealthRequest.FromString,
@@ -114,6 +165,87 @@ class InferenceService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def PredictBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/inference.InferenceService/PredictBatch',
+            inference__pb2.PredictBatchRequest.SerializeToString,
+            inference__pb2.PredictBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def PredictStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/inference.InferenceService/PredictStream',
+            inference__pb2.PredictRequest.SerializeToString,
+            inference__pb2.PredictResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ReloadModel(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/inference.InferenceService/ReloadModel',
+            inference__pb2.ReloadModelRequest.SerializeToString,
+            inference__pb2.ReloadModelResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def Health(request,
             target,
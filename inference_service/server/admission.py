@@ -0,0 +1,48 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from inference_service.utils.metrics import INFERENCE_IN_FLIGHT, INFERENCE_QUEUE_DEPTH
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request arrives while the wait queue is full"""
+
+
+class AdmissionController:
+    """Bound concurrent model work for the asyncio server.
+
+    At most ``max_in_flight`` requests execute at once and at most
+    ``max_queue_depth`` more may wait for a slot; anything beyond that is
+    rejected immediately instead of queueing without bound.
+    """
+
+    def __init__(self, max_in_flight, max_queue_depth):
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.max_queue_depth = max(0, int(max_queue_depth))
+        self.in_flight = 0
+        self.queued = 0
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+
+    @asynccontextmanager
+    async def admit(self):
+        if self._slots.locked() and self.queued >= self.max_queue_depth:
+            raise AdmissionRejected(
+                f"Server saturated ({self.in_flight} in flight, {self.queued} queued)"
+            )
+
+        self.queued += 1
+        INFERENCE_QUEUE_DEPTH.set(self.queued)
+        try:
+            await self._slots.acquire()
+        finally:
+            self.queued -= 1
+            INFERENCE_QUEUE_DEPTH.set(self.queued)
+
+        self.in_flight += 1
+        INFERENCE_IN_FLIGHT.set(self.in_flight)
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            INFERENCE_IN_FLIGHT.set(self.in_flight)
+            self._slots.release()
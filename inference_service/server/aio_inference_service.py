@@ -0,0 +1,140 @@
+import asyncio
+import logging
+
+import grpc
+from inference_service.proto import inference_pb2
+from inference_service.proto import inference_pb2_grpc
+from inference_service.server.admission import AdmissionController, AdmissionRejected
+from inference_service.server.inference_service import InferenceServicer
+from inference_service.utils.metrics import (
+    INFERENCE_ERRORS,
+    INFERENCE_REJECTED,
+    INFERENCE_REQUEST_TIME,
+)
+
+
+class AsyncInferenceServicer(inference_pb2_grpc.InferenceServiceServicer):
+    """grpc.aio front-end for InferenceServicer with admission control.
+
+    Model work runs on the request batcher thread, the event loop only awaits
+    its futures. Requests beyond the in-flight and queue limits are rejected
+    with RESOURCE_EXHAUSTED and a ``grpc-retry-pushback-ms`` hint.
+    """
+
+    def __init__(self, servicer=None):
+        self.logger = logging.getLogger(__name__)
+        self.servicer = servicer or InferenceServicer()
+        config = self.servicer.model_handler.config
+        self.admission = AdmissionController(config.MAX_IN_FLIGHT, config.MAX_QUEUE_DEPTH)
+        self.retry_after_ms = config.RETRY_AFTER_MS
+        self.logger.info("AsyncInferenceServicer initialized")
+
+    async def _reject(self, context, method, error):
+        INFERENCE_REJECTED.labels(method=method).inc()
+        INFERENCE_ERRORS.labels(method=method, code="RESOURCE_EXHAUSTED").inc()
+        self.logger.warning(f"Rejecting {method}: {str(error)}")
+        await context.abort(
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            f"{str(error)}, retry after {self.retry_after_ms} ms",
+            trailing_metadata=(("grpc-retry-pushback-ms", str(self.retry_after_ms)),),
+        )
+
+    def _submit(self, text):
+        return asyncio.wrap_future(self.servicer.batcher.submit(text))
+
+    async def Predict(self, request, context):
+        self.logger.info(f"Received prediction request: {request.text[:50]}...")
+
+        try:
+            with INFERENCE_REQUEST_TIME.labels(method="Predict").time():
+                async with self.admission.admit():
+                    result = await self._submit(request.text)
+        except AdmissionRejected as e:
+            return await self._reject(context, "Predict", e)
+        except Exception as e:
+            self.logger.error(f"Prediction failed: {str(e)}")
+            INFERENCE_ERRORS.labels(method="Predict", code="INTERNAL").inc()
+            return await context.abort(
+                grpc.StatusCode.INTERNAL, f"Prediction failed: {str(e)}"
+            )
+
+        response = InferenceServicer._to_response(result)
+        self.logger.info(f"Prediction successful: {response.rating}")
+        return response
+
+    async def PredictBatch(self, request, context):
+        self.logger.info(f"Received batch prediction request: {len(request.texts)} texts")
+
+        try:
+            with INFERENCE_REQUEST_TIME.labels(method="PredictBatch").time():
+                async with self.admission.admit():
+                    results = await asyncio.gather(
+                        *(self._submit(text) for text in request.texts)
+                    )
+        except AdmissionRejected as e:
+            return await self._reject(context, "PredictBatch", e)
+        except Exception as e:
+            self.logger.error(f"Batch prediction failed: {str(e)}")
+            INFERENCE_ERRORS.labels(method="PredictBatch", code="INTERNAL").inc()
+            return await context.abort(
+                grpc.StatusCode.INTERNAL, f"Batch prediction failed: {str(e)}"
+            )
+
+        self.logger.info(f"Batch prediction successful: {len(results)} results")
+        return inference_pb2.PredictBatchResponse(
+            results=[InferenceServicer._to_response(result) for result in results]
+        )
+
+    async def PredictStream(self, request_iterator, context):
+        self.logger.info("Received streaming prediction request")
+
+        # A stream holds one admission slot for its whole lifetime
+        window = self.servicer.model_handler.config.BATCH_MAX_SIZE
+        pending = []
+        count = 0
+
+        try:
+            with INFERENCE_REQUEST_TIME.labels(method="PredictStream").time():
+                async with self.admission.admit():
+                    async for request in request_iterator:
+                        pending.append(self._submit(request.text))
+                        if len(pending) >= window:
+                            yield InferenceServicer._to_response(await pending.pop(0))
+                            count += 1
+
+                    for future in pending:
+                        yield InferenceServicer._to_response(await future)
+                        count += 1
+        except AdmissionRejected as e:
+            await self._reject(context, "PredictStream", e)
+            return
+        except Exception as e:
+            self.logger.error(f"Streaming prediction failed: {str(e)}")
+            INFERENCE_ERRORS.labels(method="PredictStream", code="INTERNAL").inc()
+            await context.abort(grpc.StatusCode.INTERNAL, f"Prediction failed: {str(e)}")
+            return
+
+        self.logger.info(f"Streaming prediction finished: {count} results")
+
+    async def ReloadModel(self, request, context):
+        self.logger.info(f"Received model reload request: {request.version or 'latest'}")
+        model_handler = self.servicer.model_handler
+
+        try:
+            # Loading blocks, keep it off the event loop
+            previous = await asyncio.get_running_loop().run_in_executor(
+                None, model_handler.reload, request.version or None
+            )
+        except Exception as e:
+            self.logger.error(f"Model reload failed: {str(e)}")
+            INFERENCE_ERRORS.labels(method="ReloadModel", code="FAILED_PRECONDITION").inc()
+            return await context.abort(
+                grpc.StatusCode.FAILED_PRECONDITION, f"Model reload failed: {str(e)}"
+            )
+
+        return inference_pb2.ReloadModelResponse(
+            model_version=model_handler.model_version, previous_version=previous
+        )
+
+    async def Health(self, request, context):
+        return self.servicer.Health(request, context)
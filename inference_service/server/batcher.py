@@ -0,0 +1,119 @@
+import queue
+import threading
+import time
+import logging
+from concurrent.futures import Future
+
+from inference_service.utils.metrics import INFERENCE_BATCH_SIZE, INFERENCE_QUEUE_WAIT_TIME
+
+
+class RequestBatcher:
+    """Coalesce concurrent predictions into a single batched model call.
+
+    Requests are queued and flushed to ``predict_batch_fn`` once ``max_batch_size``
+    texts have been collected or the oldest one has waited ``max_wait_ms``,
+    whichever comes first.
+    """
+
+    def __init__(self, predict_batch_fn, max_batch_size=16, max_wait_ms=10):
+        self.logger = logging.getLogger(__name__)
+        self.predict_batch_fn = predict_batch_fn
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+
+        self._queue = queue.Queue()
+        self._stopped = threading.Event()
+        self._worker = threading.Thread(
+            target=self._run, name="request-batcher", daemon=True
+        )
+        self._worker.start()
+        self.logger.info(
+            f"Request batcher started (max_batch_size={self.max_batch_size}, "
+            f"max_wait_ms={self.max_wait * 1000:.1f})"
+        )
+
+    def submit(self, text):
+        """Queue a text for prediction and return a Future for its result"""
+        if self._stopped.is_set():
+            raise RuntimeError("Request batcher is stopped")
+        future = Future()
+        self._queue.put((text, future, time.monotonic()))
+        return future
+
+    def predict(self, text, timeout=None):
+        """Blocking helper returning the ``predict_batch_fn`` result for ``text``"""
+        return self.submit(text).result(timeout=timeout)
+
+    def stop(self):
+        """Stop the worker thread, failing any requests still queued"""
+        self._stopped.set()
+        self._queue.put(None)
+        self._worker.join()
+
+    def _collect(self):
+        """Block for the first request, then gather more until a limit is hit"""
+        first = self._queue.get()
+        if first is None:
+            return None
+
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                # Put the sentinel back so the run loop exits after this flush
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                break
+            try:
+                self._flush(batch)
+            except Exception as e:
+                # One bad batch must not kill the thread every later request waits on
+                self.logger.error(f"Error flushing batch: {str(e)}")
+
+        # Fail whatever is left so callers do not hang on shutdown
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None and item[1].set_running_or_notify_cancel():
+                item[1].set_exception(RuntimeError("Request batcher is stopped"))
+
+    def _flush(self, batch):
+        now = time.monotonic()
+        for _, _, enqueued in batch:
+            INFERENCE_QUEUE_WAIT_TIME.observe(now - enqueued)
+
+        # Requests cancelled by their caller (deadline, disconnect) are dropped,
+        # the rest can no longer be cancelled while the batch runs
+        batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        texts = [text for text, _, _ in batch]
+        futures = [future for _, future, _ in batch]
+        INFERENCE_BATCH_SIZE.observe(len(batch))
+
+        try:
+            results = self.predict_batch_fn(texts)
+        except Exception as e:
+            self.logger.error(f"Batch prediction failed: {str(e)}")
+            for future in futures:
+                future.set_exception(e)
+            return
+
+        for future, result in zip(futures, results):
+            future.set_result(result)
@@ -0,0 +1,69 @@
+import logging
+import threading
+
+
+class HealthMonitor:
+    """Track liveness and readiness without touching the model per request.
+
+    Readiness is set once ``self_test_fn`` has passed a warm-up run in the
+    background. If ``interval`` is positive the self-test is repeated every
+    ``interval`` seconds and readiness follows its latest result.
+    """
+
+    # Delay between warm-up attempts when periodic self-tests are disabled
+    WARMUP_RETRY_SECONDS = 5
+
+    def __init__(self, self_test_fn, interval=0):
+        self.logger = logging.getLogger(__name__)
+        self.self_test_fn = self_test_fn
+        self.interval = float(interval)
+
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def live(self):
+        return not self._stopped.is_set()
+
+    @property
+    def ready(self):
+        return self._ready.is_set()
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="health-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._ready.clear()
+
+    def _check(self):
+        try:
+            healthy = bool(self.self_test_fn())
+        except Exception as e:
+            self.logger.error(f"Self-test failed: {str(e)}")
+            healthy = False
+
+        if healthy:
+            self._ready.set()
+        else:
+            self._ready.clear()
+        return healthy
+
+    def _run(self):
+        self.logger.info("Running warm-up inference...")
+        if self._check():
+            self.logger.info("Warm-up finished, service is ready")
+        else:
+            self.logger.error("Warm-up failed, service is not ready")
+
+        while True:
+            if self.interval <= 0 and self.ready:
+                return
+            delay = self.interval if self.interval > 0 else self.WARMUP_RETRY_SECONDS
+            if self._stopped.wait(delay):
+                return
+            self._check()
@@ -1,18 +1,49 @@
 import grpc
 import time
+import asyncio
 import logging
 from concurrent import futures
 
+from prometheus_client import start_http_server
+
+from inference_service.config.config import ModelConfig
 from inference_service.proto import inference_pb2_grpc
 from inference_service.server.inference_service import InferenceServicer
 from inference_service.utils.logging_utils import setup_logging
 
+# Accept keepalive pings from pooled, long-lived client channels
+SERVER_OPTIONS = [
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.min_recv_ping_interval_without_data_ms", 10000),
+    ("grpc.http2.max_ping_strikes", 0),
+]
+
 
 def serve(port=50051):
     setup_logging()
     logger = logging.getLogger(__name__)
+    config = ModelConfig()
+
+    start_http_server(config.METRICS_PORT)
+    logger.info(f"Metrics server started on port {config.METRICS_PORT}")
 
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    if config.SERVER_MODE == "aio":
+        asyncio.run(serve_aio(port, config))
+        return
+
+    # Handler threads mostly wait on the request batcher, so this bounds how
+    # many requests can be coalesced into one model batch.
+    server = grpc.server(
+        futures.ThreadPoolExecutor(
+            max_workers=max(config.MAX_WORKERS, config.BATCH_MAX_SIZE)
+        ),
+        # With MAX_IN_FLIGHT/MAX_QUEUE_DEPTH set, gRPC answers RESOURCE_EXHAUSTED
+        # beyond their sum instead of queueing
+        maximum_concurrent_rpcs=(
+            config.MAX_IN_FLIGHT + config.MAX_QUEUE_DEPTH if config.ADMISSION_CONTROL else None
+        ),
+        options=SERVER_OPTIONS,
+    )
     inference_pb2_grpc.add_InferenceServiceServicer_to_server(
         InferenceServicer(), server
     )
@@ -28,5 +59,28 @@ def serve(port=50051):
         logger.info("Server stopped")
 
 
+async def serve_aio(port, config):
+    from inference_service.server.aio_inference_service import AsyncInferenceServicer
+
+    logger = logging.getLogger(__name__)
+
+    server = grpc.aio.server(options=SERVER_OPTIONS)
+    inference_pb2_grpc.add_InferenceServiceServicer_to_server(
+        AsyncInferenceServicer(), server
+    )
+    server.add_insecure_port(f"[::]:{port}")
+    await server.start()
+    logger.info(
+        f"Async server started, listening on port {port} "
+        f"(max_in_flight={config.MAX_IN_FLIGHT}, max_queue_depth={config.MAX_QUEUE_DEPTH})"
+    )
+
+    try:
+        await server.wait_for_termination()
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        await server.stop(0)
+        logger.info("Server stopped")
+
+
 if __name__ == "__main__":
     serve()
@@ -1,38 +1,130 @@
 import logging
+from collections import deque
 
 import grpc
 from inference_service.proto import inference_pb2
 from inference_service.proto import inference_pb2_grpc
+from inference_service.server.batcher import RequestBatcher
+from inference_service.server.health import HealthMonitor
 from inference_service.server.model_handler import ModelHandler
+from inference_service.utils.metrics import (
+    INFERENCE_ERRORS,
+    INFERENCE_IN_FLIGHT,
+    INFERENCE_REQUEST_TIME,
+    INFERENCE_STAGE_TIME,
+)
 
 
 class InferenceServicer(inference_pb2_grpc.InferenceServiceServicer):
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.model_handler = ModelHandler()
+        self.batcher = RequestBatcher(
+            self.model_handler.predict_batch,
+            max_batch_size=self.model_handler.config.BATCH_MAX_SIZE,
+            max_wait_ms=self.model_handler.config.BATCH_MAX_WAIT_MS,
+        )
+        self.health = HealthMonitor(
+            self.model_handler.check_health,
+            interval=self.model_handler.config.HEALTH_SELF_TEST_INTERVAL,
+        )
+        self.health.start()
         self.logger.info("InferenceServicer initialized")
 
+    @INFERENCE_IN_FLIGHT.track_inprogress()
+    @INFERENCE_REQUEST_TIME.labels(method="Predict").time()
     def Predict(self, request, context):
         self.logger.info(f"Received prediction request: {request.text[:50]}...")
 
         try:
-            prediction, confidence, rating = self.model_handler.predict(request.text)
-
-            response = inference_pb2.PredictResponse(
-                prediction=str(prediction), confidence=float(confidence), rating=rating
-            )
+            response = self._to_response(self.batcher.predict(request.text))
 
-            self.logger.info(f"Prediction successful: {rating}")
+            self.logger.info(f"Prediction successful: {response.rating}")
             return response
 
         except Exception as e:
             self.logger.error(f"Prediction failed: {str(e)}")
+            INFERENCE_ERRORS.labels(method="Predict", code="INTERNAL").inc()
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Prediction failed: {str(e)}")
             return inference_pb2.PredictResponse()
 
+    @INFERENCE_IN_FLIGHT.track_inprogress()
+    @INFERENCE_REQUEST_TIME.labels(method="PredictBatch").time()
+    def PredictBatch(self, request, context):
+        self.logger.info(f"Received batch prediction request: {len(request.texts)} texts")
+
+        try:
+            # Queue every text at once so the batcher flushes full model batches
+            futures = [self.batcher.submit(text) for text in request.texts]
+            results = [self._to_response(future.result()) for future in futures]
+
+            self.logger.info(f"Batch prediction successful: {len(results)} results")
+            return inference_pb2.PredictBatchResponse(results=results)
+
+        except Exception as e:
+            self.logger.error(f"Batch prediction failed: {str(e)}")
+            INFERENCE_ERRORS.labels(method="PredictBatch", code="INTERNAL").inc()
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Batch prediction failed: {str(e)}")
+            return inference_pb2.PredictBatchResponse()
+
+    def PredictStream(self, request_iterator, context):
+        self.logger.info("Received streaming prediction request")
+
+        # Keep up to one model batch of this stream in flight, answering in order
+        window = self.model_handler.config.BATCH_MAX_SIZE
+        pending = deque()
+        count = 0
+
+        try:
+            # Measured in the body, decorators would only see the generator being created
+            with INFERENCE_IN_FLIGHT.track_inprogress(), \
+                    INFERENCE_REQUEST_TIME.labels(method="PredictStream").time():
+                for request in request_iterator:
+                    pending.append(self.batcher.submit(request.text))
+                    if len(pending) >= window:
+                        yield self._to_response(pending.popleft().result())
+                        count += 1
+
+                while pending:
+                    yield self._to_response(pending.popleft().result())
+                    count += 1
+
+            self.logger.info(f"Streaming prediction finished: {count} results")
+
+        except Exception as e:
+            self.logger.error(f"Streaming prediction failed: {str(e)}")
+            INFERENCE_ERRORS.labels(method="PredictStream", code="INTERNAL").inc()
+            context.abort(grpc.StatusCode.INTERNAL, f"Prediction failed: {str(e)}")
+
+        finally:
+            # A cancelled or aborted stream leaves its queued texts to the batcher
+            for future in pending:
+                future.cancel()
+
+    def ReloadModel(self, request, context):
+        self.logger.info(f"Received model reload request: {request.version or 'latest'}")
+
+        try:
+            previous = self.model_handler.reload(request.version or None)
+        except Exception as e:
+            self.logger.error(f"Model reload failed: {str(e)}")
+            INFERENCE_ERRORS.labels(method="ReloadModel", code="FAILED_PRECONDITION").inc()
+            context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+            context.set_details(f"Model reload failed: {str(e)}")
+            return inference_pb2.ReloadModelResponse()
+
+        return inference_pb2.ReloadModelResponse(
+            model_version=self.model_handler.model_version, previous_version=previous
+        )
+
     def Health(self, request, context):
-        status = self.model_handler.check_health()
+        # Answered from cached state, the model is only exercised by HealthMonitor
+        if request.probe == inference_pb2.HealthRequest.Probe.LIVENESS:
+            status = self.health.live
+        else:
+            status = self.health.ready
         response = inference_pb2.HealthResponse(
             status=(
                 inference_pb2.HealthResponse.Status.SERVING
@@ -41,3 +133,14 @@ class InferenceServicer(inference_pb2_grpc.InferenceServiceServicer):
             )
         )
         return response
+
+    @staticmethod
+    @INFERENCE_STAGE_TIME.labels(stage="serialize").time()
+    def _to_response(result):
+        prediction, confidence, rating, model_version = result
+        return inference_pb2.PredictResponse(
+            prediction=str(prediction),
+            confidence=float(confidence),
+            rating=rating,
+            model_version=model_version,
+        )
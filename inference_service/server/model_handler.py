@@ -1,11 +1,22 @@
-import torch
+import os
+import time
 import logging
-import numpy as np
-from pyspark.sql import SparkSession
-from pyspark.ml import PipelineModel
-from pyspark.ml.linalg import Vectors
-from transformers import AutoTokenizer, AutoModel
+import threading
 from inference_service.config.config import ModelConfig
+from inference_service.server.model_registry import ModelRegistry
+from inference_service.server.tree_ensemble import TreeEnsemble
+from inference_service.utils.embedding_cache import EmbeddingCache, cache_revision
+from inference_service.utils.encoders import TorchEncoder, check_parity, create_encoder
+from inference_service.utils.metrics import (
+    INFERENCE_MODEL_RELOADS,
+    INFERENCE_MODEL_VERSION,
+    INFERENCE_STAGE_TIME,
+)
+
+# Version reported when models are loaded from fixed paths instead of a registry
+STATIC_VERSION = "static"
+
+HEALTH_CHECK_TEXT = "Sample text for health check"
 
 
 class ModelHandler:
@@ -13,68 +24,182 @@ class ModelHandler:
         self.logger = logging.getLogger(__name__)
         self.config = ModelConfig()
 
-        # Initialize Spark
-        self.spark = SparkSession.builder.appName("ModelInference").getOrCreate()
-
         # Load tokenizer and BERT model
-        self.logger.info("Loading tokenizer and BERT model...")
-        self.tokenizer = AutoTokenizer.from_pretrained(self.config.BERT_MODEL_PATH)
-        self.bert_model = AutoModel.from_pretrained(self.config.BERT_MODEL_PATH)
+        self.logger.info(
+            f"Loading tokenizer and BERT model ({self.config.ENCODER_BACKEND} backend)..."
+        )
+        self.encoder = self._load_encoder()
+        self.embedding_cache = EmbeddingCache(
+            self.config.BERT_MODEL_PATH,
+            revision=cache_revision(self.config.BERT_MODEL_REVISION, self.encoder.precision),
+            max_entries=self.config.EMBEDDING_CACHE_SIZE,
+            redis_url=self.config.EMBEDDING_CACHE_REDIS_URL,
+            ttl=self.config.EMBEDDING_CACHE_TTL,
+        )
 
-        # Load Spark pipeline model
-        self.logger.info("Loading Spark pipeline model...")
-        self.model = PipelineModel.load(self.config.SPARK_MODEL_PATH)
+        self.registry = None
+        if self.config.MODEL_REGISTRY_DIR:
+            self.registry = ModelRegistry(self.config.MODEL_REGISTRY_DIR)
+        self._reload_lock = threading.Lock()
+
+        # (version, classifier) is swapped as a whole on reload
+        version = self.registry.latest() if self.registry else STATIC_VERSION
+        if version is None:
+            raise RuntimeError(f"No model versions in {self.config.MODEL_REGISTRY_DIR}")
+        self._active = (version, self._load_classifier(version))
+        INFERENCE_MODEL_VERSION.labels(version=version).set(1)
+        self.logger.info(f"Serving classifier version {version}")
+
+        if self.registry and self.config.MODEL_WATCH_INTERVAL > 0:
+            self._watcher = threading.Thread(
+                target=self._watch_registry, name="model-watcher", daemon=True
+            )
+            self._watcher.start()
 
         self.logger.info("Model handler initialized successfully")
 
-    def predict(self, text):
-        """Perform prediction on input text"""
-        self.logger.info("Generating embeddings...")
-
-        # Tokenize input
-        tokens = self.tokenizer(
-            text,
-            return_tensors="pt",
-            truncation=True,
-            padding=True,
-            max_length=512,
+    def _load_encoder(self):
+        encoder = create_encoder(
+            self.config.ENCODER_BACKEND,
+            self.config.BERT_MODEL_PATH,
+            revision=self.config.BERT_MODEL_REVISION,
+            num_threads=self.config.ENCODER_THREADS,
+            onnx_path=self.config.ONNX_MODEL_PATH,
         )
+        if not self.config.ENCODER_PARITY_CHECK or self.config.ENCODER_BACKEND == "torch":
+            return encoder
+
+        # Compare against the fp32 reference and fall back to it on mismatch
+        reference = TorchEncoder(
+            self.config.BERT_MODEL_PATH,
+            revision=self.config.BERT_MODEL_REVISION,
+            num_threads=self.config.ENCODER_THREADS,
+        )
+        ok, max_abs_diff, cosine = check_parity(
+            reference, encoder, min_cosine=self.config.ENCODER_MIN_COSINE
+        )
+        if ok:
+            self.logger.info(
+                f"Encoder parity OK (max abs diff {max_abs_diff:.6f}, min cosine {cosine:.6f})"
+            )
+            return encoder
+
+        self.logger.error(
+            f"Encoder parity failed (max abs diff {max_abs_diff:.6f}, "
+            f"min cosine {cosine:.6f}), falling back to fp32 torch"
+        )
+        return reference
 
-        # Generate vector embeddings
-        with torch.no_grad():
-            outputs = self.bert_model(**tokens)
-            # Use the [CLS] token representation as the vector
-            vector = outputs.last_hidden_state[:, 0, :].squeeze().tolist()
-
-        # Create DataFrame with vector
-        data_list = [(Vectors.dense(vector),)]
-        df = self.spark.createDataFrame(data_list, ["vectors"])
+    def predict(self, text):
+        """Perform prediction on input text"""
+        return self.predict_batch([text])[0]
 
-        # Get predictions
-        self.logger.info("Running prediction...")
-        predictions = self.model.transform(df)
+    def predict_batch(self, texts):
+        """Perform prediction on a batch of texts in a single model pass.
 
-        # Extract prediction
-        prediction = predictions.select("prediction").collect()[0][0]
+        Returns ``(prediction, confidence, rating, model_version)`` per text.
+        """
+        # Pin the active model so a concurrent reload cannot change it mid-batch
+        version, classifier = self._active
+        results = self.classify(self.embed(texts), classifier)
+        return [result + (version,) for result in results]
 
-        # Get confidence (probabilities)
-        if "probability" in predictions.columns:
-            probability = predictions.select("probability").collect()[0][0]
-            confidence = float(max(probability.toArray()))
-        else:
-            confidence = 1.0  # Default if no probability column
+    @property
+    def model_version(self):
+        return self._active[0]
 
-        # Get the predicted label
-        label_mapping = self.model.stages[0].labels
-        rating = label_mapping[int(prediction)]
+    def classify(self, vectors, classifier=None):
+        """Run the review classifier on a (n, hidden) array of embeddings"""
+        classifier = classifier or self._active[1]
+        self.logger.info("Running prediction...")
+        with INFERENCE_STAGE_TIME.labels(stage="classify").time():
+            return classifier.predict(vectors)
+
+    def _load_classifier(self, version):
+        if self.config.CLASSIFIER_BACKEND == "numpy":
+            # Load exported tree ensemble, no Spark/JVM needed
+            self.logger.info(f"Loading NumPy tree ensemble ({version})...")
+            if self.registry:
+                path = self.registry.tree_ensemble_path(version)
+            else:
+                path = self.config.TREE_ENSEMBLE_PATH
+            if not os.path.exists(path):
+                raise RuntimeError(
+                    f"Tree ensemble {path} not found, export it with "
+                    f"python -m inference_service.server.tree_ensemble or set CLASSIFIER_BACKEND=spark"
+                )
+            return TreeEnsemble.load(path)
+
+        from inference_service.server.spark_classifier import SparkClassifier
 
-        return prediction, confidence, rating
+        # Load Spark pipeline model
+        self.logger.info(f"Loading Spark pipeline model ({version})...")
+        if self.registry:
+            return SparkClassifier(self.registry.spark_model_path(version))
+        return SparkClassifier(self.config.SPARK_MODEL_PATH)
+
+    def reload(self, version=None):
+        """Load ``version`` (default: latest in the registry), warm it up and swap it in.
+
+        Requests already running keep using the previous classifier. Returns
+        the previously active version.
+        """
+        if self.registry is None:
+            raise RuntimeError("Hot reload requires MODEL_REGISTRY_DIR")
+
+        with self._reload_lock:
+            version = version or self.registry.latest()
+            previous = self.model_version
+            if version is None or version == previous:
+                return previous
+
+            try:
+                classifier = self._load_classifier(version)
+                # Warm up on a real embedding before serving traffic
+                classifier.predict(self._encode([HEALTH_CHECK_TEXT]))
+            except Exception:
+                INFERENCE_MODEL_RELOADS.labels(result="failure").inc()
+                raise
+
+            self._active = (version, classifier)
+            INFERENCE_MODEL_VERSION.labels(version=previous).set(0)
+            INFERENCE_MODEL_VERSION.labels(version=version).set(1)
+            INFERENCE_MODEL_RELOADS.labels(result="success").inc()
+            self.logger.info(f"Swapped classifier version {previous} -> {version}")
+            return previous
+
+    def _watch_registry(self):
+        failed = set()
+        while True:
+            time.sleep(self.config.MODEL_WATCH_INTERVAL)
+            latest = self.registry.latest()
+            if not latest or latest == self.model_version or latest in failed:
+                continue
+            try:
+                self.logger.info(f"New model version {latest} found in registry")
+                self.reload(latest)
+            except Exception as e:
+                # Do not retry a broken version until a newer one is published
+                failed.add(latest)
+                self.logger.error(f"Model reload of {latest} failed: {str(e)}")
+
+    def embed(self, texts):
+        """Return the [CLS] embeddings of ``texts`` as a (n, hidden) array"""
+        return self.embedding_cache.get_or_compute(texts, self._encode)
+
+    def _encode(self, texts):
+        """Run HerBERT on ``texts`` and return their [CLS] embeddings"""
+        self.logger.info(f"Generating embeddings for {len(texts)} texts...")
+        with INFERENCE_STAGE_TIME.labels(stage="tokenize").time():
+            tokens = self.encoder.tokenize(texts)
+        with INFERENCE_STAGE_TIME.labels(stage="encode").time():
+            return self.encoder.forward(tokens)
 
     def check_health(self):
         """Check if the model is healthy"""
         try:
-            # Simple health check - try to predict a sample text
-            self.predict("Sample text for health check")
+            # Run the full model path, bypassing the embedding cache
+            self.classify(self._encode([HEALTH_CHECK_TEXT]))
             return True
         except Exception as e:
             self.logger.error(f"Health check failed: {str(e)}")
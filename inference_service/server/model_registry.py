@@ -0,0 +1,58 @@
+import os
+
+# Layout of a single model version inside the registry
+SPARK_MODEL_DIR = "review_classification_model"
+TREE_ENSEMBLE_FILE = "review_classification_model.npz"
+CURRENT_FILE = "CURRENT"
+
+
+class ModelRegistry:
+    """Directory of versioned classifier models.
+
+    Every subdirectory of ``root`` is a version holding the Spark pipeline
+    (``review_classification_model/``) and/or its NumPy export
+    (``review_classification_model.npz``). The active version is the one named
+    in ``root/CURRENT`` or, without that file, the greatest version name.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def versions(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name
+            for name in os.listdir(self.root)
+            if os.path.isdir(os.path.join(self.root, name)) and not name.startswith(".")
+        )
+
+    def latest(self):
+        current = os.path.join(self.root, CURRENT_FILE)
+        if os.path.exists(current):
+            with open(current) as f:
+                version = f.read().strip()
+            if version:
+                return version
+        versions = self.versions()
+        return versions[-1] if versions else None
+
+    def path(self, version):
+        path = os.path.join(self.root, version)
+        if not os.path.isdir(path):
+            raise ValueError(f"Model version {version!r} not found in {self.root}")
+        return path
+
+    def spark_model_path(self, version):
+        return os.path.join(self.path(version), SPARK_MODEL_DIR)
+
+    def tree_ensemble_path(self, version):
+        return os.path.join(self.path(version), TREE_ENSEMBLE_FILE)
+
+    def publish(self, version):
+        """Point ``CURRENT`` at ``version``, written atomically"""
+        self.path(version)
+        tmp = os.path.join(self.root, f".{CURRENT_FILE}.tmp")
+        with open(tmp, "w") as f:
+            f.write(version)
+        os.replace(tmp, os.path.join(self.root, CURRENT_FILE))
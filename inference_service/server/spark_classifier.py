@@ -0,0 +1,42 @@
+from pyspark.sql import SparkSession
+from pyspark.ml import PipelineModel
+from pyspark.ml.linalg import Vectors
+
+
+class SparkClassifier:
+    """Review classifier backed by the Spark ``PipelineModel``"""
+
+    def __init__(self, path):
+        # Reuses the running session when several model versions are loaded
+        self.spark = SparkSession.builder.appName("ModelInference").getOrCreate()
+        self.model = PipelineModel.load(path)
+
+    def predict(self, vectors):
+        """Return ``(prediction, confidence, rating)`` for every vector"""
+        # Create DataFrame with vectors, keeping the input position of each row
+        data_list = [
+            (idx, Vectors.dense(vector.tolist())) for idx, vector in enumerate(vectors)
+        ]
+        df = self.spark.createDataFrame(data_list, ["idx", "vectors"])
+
+        # Get predictions
+        predictions = self.model.transform(df)
+
+        has_probability = "probability" in predictions.columns
+        columns = ["idx", "prediction"] + (["probability"] if has_probability else [])
+        rows = sorted(predictions.select(*columns).collect(), key=lambda row: row[0])
+
+        # Get the predicted label
+        label_mapping = self.model.stages[0].labels
+
+        results = []
+        for row in rows:
+            prediction = row["prediction"]
+            if has_probability:
+                confidence = float(max(row["probability"].toArray()))
+            else:
+                confidence = 1.0  # Default if no probability column
+            rating = label_mapping[int(prediction)]
+            results.append((prediction, confidence, rating))
+
+        return results
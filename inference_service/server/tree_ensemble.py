@@ -0,0 +1,190 @@
+import logging
+import argparse
+import numpy as np
+
+
+class TreeEnsemble:
+    """Array-backed random forest that scores CLS vectors without Spark.
+
+    All trees are flattened into shared node arrays. ``feature`` is ``-1`` for
+    leaves, internal nodes send a sample left when
+    ``x[feature] <= threshold`` (the Spark ``ContinuousSplit`` rule) and
+    ``value`` holds the normalized class distribution of every leaf.
+    """
+
+    def __init__(
+        self, labels, feature, threshold, left, right, value, roots, tree_weights
+    ):
+        self.labels = [str(label) for label in labels]
+        self.feature = np.asarray(feature, dtype=np.int32)
+        self.threshold = np.asarray(threshold, dtype=np.float64)
+        self.left = np.asarray(left, dtype=np.int32)
+        self.right = np.asarray(right, dtype=np.int32)
+        self.value = np.asarray(value, dtype=np.float32)
+        self.roots = np.asarray(roots, dtype=np.int32)
+        self.tree_weights = np.asarray(tree_weights, dtype=np.float64)
+
+    @property
+    def num_trees(self):
+        return len(self.roots)
+
+    @property
+    def num_classes(self):
+        return self.value.shape[1]
+
+    def save(self, path):
+        """Write the ensemble to a ``.npz`` file"""
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                labels=np.array(self.labels),
+                feature=self.feature,
+                threshold=self.threshold,
+                left=self.left,
+                right=self.right,
+                value=self.value,
+                roots=self.roots,
+                tree_weights=self.tree_weights,
+            )
+
+    @classmethod
+    def load(cls, path):
+        """Load an ensemble written by :meth:`save`"""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                labels=data["labels"],
+                feature=data["feature"],
+                threshold=data["threshold"],
+                left=data["left"],
+                right=data["right"],
+                value=data["value"],
+                roots=data["roots"],
+                tree_weights=data["tree_weights"],
+            )
+
+    def leaves(self, vectors):
+        """Return the leaf node reached in every tree, shape (n_samples, n_trees)"""
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float64))
+        rows = np.arange(vectors.shape[0])[:, None]
+        nodes = np.tile(self.roots, (vectors.shape[0], 1))
+
+        while True:
+            features = self.feature[nodes]
+            internal = features >= 0
+            if not internal.any():
+                return nodes
+            values = vectors[rows, np.where(internal, features, 0)]
+            go_left = values <= self.threshold[nodes]
+            children = np.where(go_left, self.left[nodes], self.right[nodes])
+            nodes = np.where(internal, children, nodes)
+
+    def predict_proba(self, vectors):
+        """Class probabilities, matching Spark's ``probability`` column"""
+        raw = np.einsum("ntc,t->nc", self.value[self.leaves(vectors)], self.tree_weights)
+        return raw / raw.sum(axis=1, keepdims=True)
+
+    def predict(self, vectors):
+        """Return ``(prediction, confidence, rating)`` for every vector"""
+        probabilities = self.predict_proba(vectors)
+        indices = probabilities.argmax(axis=1)
+        return [
+            (float(idx), float(probabilities[row, idx]), self.labels[idx])
+            for row, idx in enumerate(indices)
+        ]
+
+
+def _export_tree(root, num_classes, offset):
+    """Flatten one Spark decision tree (a py4j ``Node``) into node arrays"""
+    feature, threshold, left, right, value = [], [], [], [], []
+    stack = [(root, None, None)]
+
+    while stack:
+        node, parent, is_left = stack.pop()
+        idx = len(feature)
+        if parent is not None:
+            (left if is_left else right)[parent] = offset + idx
+
+        stats = np.array(list(node.impurityStats().stats()), dtype=np.float64)
+        total = stats.sum()
+        value.append(stats / total if total > 0 else np.full(num_classes, 1.0 / num_classes))
+        left.append(-1)
+        right.append(-1)
+
+        if node.getClass().getSimpleName() == "InternalNode":
+            split = node.split()
+            if split.getClass().getSimpleName() != "ContinuousSplit":
+                raise ValueError("Only continuous splits are supported")
+            feature.append(int(split.featureIndex()))
+            threshold.append(float(split.threshold()))
+            stack.append((node.rightChild(), idx, False))
+            stack.append((node.leftChild(), idx, True))
+        else:
+            feature.append(-1)
+            threshold.append(0.0)
+
+    return feature, threshold, left, right, value
+
+
+def export_pipeline_model(pipeline_model):
+    """Convert a fitted review classification ``PipelineModel`` to a TreeEnsemble"""
+    from pyspark.ml.classification import RandomForestClassificationModel
+    from pyspark.ml.feature import StringIndexerModel
+
+    indexer = next(s for s in pipeline_model.stages if isinstance(s, StringIndexerModel))
+    forest = next(
+        s for s in pipeline_model.stages if isinstance(s, RandomForestClassificationModel)
+    )
+    num_classes = forest.numClasses
+
+    feature, threshold, left, right, value, roots = [], [], [], [], [], []
+    for tree in forest.trees:
+        roots.append(len(feature))
+        arrays = _export_tree(tree._java_obj.rootNode(), num_classes, len(feature))
+        for target, part in zip((feature, threshold, left, right, value), arrays):
+            target.extend(part)
+
+    return TreeEnsemble(
+        labels=indexer.labels,
+        feature=feature,
+        threshold=threshold,
+        left=left,
+        right=right,
+        value=np.vstack(value),
+        roots=roots,
+        tree_weights=forest.treeWeights,
+    )
+
+
+def main():
+    from pyspark.ml import PipelineModel
+    from pyspark.sql import SparkSession
+    from inference_service.config.config import ModelConfig
+    from inference_service.utils.logging_utils import setup_logging
+
+    setup_logging()
+    logger = logging.getLogger(__name__)
+    config = ModelConfig()
+
+    parser = argparse.ArgumentParser(description="Export Spark model to NumPy")
+    parser.add_argument(
+        "--spark-model", default=config.SPARK_MODEL_PATH, help="Spark model path"
+    )
+    parser.add_argument(
+        "--output", default=config.TREE_ENSEMBLE_PATH, help="Output .npz path"
+    )
+    args = parser.parse_args()
+
+    spark = SparkSession.builder.appName("ModelExport").getOrCreate()
+    try:
+        ensemble = export_pipeline_model(PipelineModel.load(args.spark_model))
+        ensemble.save(args.output)
+        logger.info(
+            f"Exported {ensemble.num_trees} trees "
+            f"({len(ensemble.feature)} nodes) to {args.output}"
+        )
+    finally:
+        spark.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,17 @@ setup(
         "grpcio-tools",
         "torch",
         "transformers",
-        "pyspark",
         "protobuf",
         "numpy",
+        "prometheus-client",
     ],
+    extras_require={
+        # Shared Redis tier of the embedding cache
+        "redis": ["redis"],
+        # ENCODER_BACKEND=onnx / onnx-int8
+        "onnx": ["onnx", "onnxruntime"],
+        # Only needed for CLASSIFIER_BACKEND=spark (the default is numpy) and for exporting the model
+        "spark": ["pyspark"],
+    },
     python_requires=">=3.12",
 )
@@ -0,0 +1,49 @@
+import asyncio
+import threading
+
+from inference_service.server.batcher import RequestBatcher
+
+
+def test_cancelled_request_does_not_stop_batcher():
+    release = threading.Event()
+    seen = []
+
+    def predict_batch(texts):
+        seen.extend(texts)
+        release.wait(timeout=5)
+        return [text.upper() for text in texts]
+
+    batcher = RequestBatcher(predict_batch, max_batch_size=1, max_wait_ms=0)
+    try:
+        # The worker is busy with the first request while the second is cancelled in the queue
+        first = batcher.submit("a")
+        cancelled = batcher.submit("b")
+        assert cancelled.cancel()
+        release.set()
+
+        assert first.result(timeout=5) == "A"
+        assert batcher.predict("c", timeout=5) == "C"
+        assert "b" not in seen
+    finally:
+        batcher.stop()
+
+
+def test_client_deadline_does_not_stop_batcher():
+    release = threading.Event()
+    batcher = RequestBatcher(lambda texts: release.wait(timeout=5) and texts, max_wait_ms=0)
+
+    async def call(text, timeout):
+        return await asyncio.wait_for(asyncio.wrap_future(batcher.submit(text)), timeout)
+
+    async def scenario():
+        try:
+            await call("slow", 0.05)
+        except asyncio.TimeoutError:
+            pass
+        release.set()
+        return await call("next", 5)
+
+    try:
+        assert asyncio.run(scenario()) == "next"
+    finally:
+        batcher.stop()
@@ -0,0 +1,143 @@
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from inference_service.utils.metrics import (
+    EMBEDDING_CACHE_HITS,
+    EMBEDDING_CACHE_MISSES,
+    EMBEDDING_CACHE_EVICTIONS,
+)
+from inference_service.utils.text import normalize_text
+
+
+def cache_revision(revision, precision="fp32"):
+    """Cache revision of an encoder, vectors of different precisions never share entries"""
+    return f"{revision}/{precision}"
+
+
+class EmbeddingCache:
+    """Content-addressed cache of text embeddings.
+
+    Entries are keyed by the SHA-256 of the normalized text together with the
+    model name and revision, and stored as raw float32 bytes. A bounded
+    in-process LRU tier is always used; a Redis tier shared between processes
+    is added when ``redis_url`` is given.
+    """
+
+    def __init__(
+        self, model_name, revision="main", max_entries=10000, redis_url=None, ttl=None
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.prefix = f"emb:{model_name}:{revision}:"
+        self.max_entries = int(max_entries)
+        self.ttl = int(ttl) if ttl else None
+
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.redis = None
+        if redis_url:
+            import redis
+
+            self.redis = redis.Redis.from_url(redis_url)
+            self.logger.info(f"Embedding cache using Redis tier at {redis_url}")
+
+    def key(self, text):
+        digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+        return self.prefix + digest
+
+    @staticmethod
+    def encode(vector):
+        return np.asarray(vector, dtype=np.float32).tobytes()
+
+    @staticmethod
+    def decode(data):
+        return np.frombuffer(data, dtype=np.float32)
+
+    def get_many(self, texts):
+        """Return cached vectors for ``texts``, with ``None`` for misses"""
+        keys = [self.key(text) for text in texts]
+        found = [None] * len(keys)
+
+        with self._lock:
+            for i, key in enumerate(keys):
+                data = self._lru.get(key)
+                if data is not None:
+                    self._lru.move_to_end(key)
+                    found[i] = data
+        memory_hits = sum(data is not None for data in found)
+        if memory_hits:
+            EMBEDDING_CACHE_HITS.labels(tier="memory").inc(memory_hits)
+
+        missing = [i for i, data in enumerate(found) if data is None]
+        if self.redis is not None and missing:
+            try:
+                values = self.redis.mget([keys[i] for i in missing])
+            except Exception as e:
+                self.logger.warning(f"Redis embedding lookup failed: {str(e)}")
+                values = [None] * len(missing)
+
+            redis_hits = 0
+            for i, data in zip(missing, values):
+                if data is not None:
+                    found[i] = data
+                    self._remember(keys[i], data)
+                    redis_hits += 1
+            if redis_hits:
+                EMBEDDING_CACHE_HITS.labels(tier="redis").inc(redis_hits)
+
+        return [self.decode(data) if data is not None else None for data in found]
+
+    def put_many(self, texts, vectors):
+        """Store ``vectors`` for ``texts`` in every tier"""
+        items = [(self.key(text), self.encode(vector)) for text, vector in zip(texts, vectors)]
+        for key, data in items:
+            self._remember(key, data)
+
+        if self.redis is not None and items:
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                for key, data in items:
+                    pipe.set(key, data, ex=self.ttl)
+                pipe.execute()
+            except Exception as e:
+                self.logger.warning(f"Redis embedding store failed: {str(e)}")
+
+    def get_or_compute(self, texts, compute_fn):
+        """Return a (n, dim) float32 array, calling ``compute_fn`` only for misses.
+
+        ``compute_fn`` receives the list of uncached texts and must return one
+        vector per text.
+        """
+        texts = list(texts)
+        vectors = self.get_many(texts)
+
+        # Group misses by key so duplicates in one batch are encoded once
+        missing = OrderedDict()
+        for i, vector in enumerate(vectors):
+            if vector is None:
+                missing.setdefault(self.key(texts[i]), []).append(i)
+
+        if missing:
+            EMBEDDING_CACHE_MISSES.inc(len(missing))
+            missing_texts = [texts[indices[0]] for indices in missing.values()]
+            computed = np.asarray(compute_fn(missing_texts), dtype=np.float32)
+            self.put_many(missing_texts, computed)
+            for indices, vector in zip(missing.values(), computed):
+                for i in indices:
+                    vectors[i] = vector
+
+        return np.vstack(vectors) if vectors else np.empty((0, 0), dtype=np.float32)
+
+    def _remember(self, key, data):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._lru[key] = data
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+                EMBEDDING_CACHE_EVICTIONS.inc()
@@ -0,0 +1,294 @@
+import os
+import logging
+import argparse
+
+import numpy as np
+import torch
+from transformers import AutoTokenizer, AutoModel
+
+BACKENDS = ("torch", "torch-int8", "onnx", "onnx-int8")
+
+PARITY_TEXTS = [
+    "Bardzo dobry prowadzący, bardzo polecam. Zajęcia są ciekawe.",
+    "Beznadzieja, odradzam. Kolokwium trudne, zajęcia nudne.",
+    "Sample text for health check",
+]
+
+
+class _ClsModel(torch.nn.Module):
+    """Wrap a HuggingFace encoder so it returns only the [CLS] vectors"""
+
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def forward(self, input_ids, attention_mask):
+        outputs = self.model(input_ids=input_ids, attention_mask=attention_mask)
+        return outputs.last_hidden_state[:, 0, :]
+
+
+class TorchEncoder:
+    """Eager PyTorch HerBERT encoder, optionally with dynamic int8 quantization"""
+
+    def __init__(
+        self, model_name, revision="main", num_threads=0, quantize=False, max_length=512
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.max_length = max_length
+        self.precision = "int8" if quantize else "fp32"
+
+        if num_threads:
+            torch.set_num_threads(num_threads)
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name, revision=revision)
+        model = AutoModel.from_pretrained(model_name, revision=revision).eval()
+        if quantize:
+            self.logger.info("Applying dynamic int8 quantization to Linear layers")
+            model = torch.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        self.model = _ClsModel(model)
+
+    def tokenize(self, texts, return_tensors="pt"):
+        return self.tokenizer(
+            list(texts),
+            return_tensors=return_tensors,
+            truncation=True,
+            padding=True,
+            max_length=self.max_length,
+        )
+
+    def forward(self, tokens):
+        """Run the model on tokenized input, returning [CLS] vectors"""
+        with torch.no_grad():
+            vectors = self.model(tokens["input_ids"], tokens["attention_mask"])
+        return vectors.numpy()
+
+    def encode(self, texts):
+        """Return the [CLS] embeddings of ``texts`` as a (n, hidden) float32 array"""
+        return self.forward(self.tokenize(texts))
+
+
+class OnnxEncoder:
+    """HerBERT encoder running on ONNX Runtime.
+
+    The model is exported to ``onnx_path`` on first use; with ``quantize`` the
+    exported graph is additionally converted with dynamic int8 quantization.
+    """
+
+    def __init__(
+        self,
+        model_name,
+        onnx_path,
+        revision="main",
+        num_threads=0,
+        quantize=False,
+        max_length=512,
+    ):
+        import onnxruntime as ort
+
+        self.logger = logging.getLogger(__name__)
+        self.max_length = max_length
+        self.precision = "int8" if quantize else "fp32"
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name, revision=revision)
+
+        if quantize:
+            fp32_path = onnx_path
+            onnx_path = os.path.splitext(onnx_path)[0] + ".int8.onnx"
+            if not os.path.exists(onnx_path):
+                export_onnx(model_name, fp32_path, revision=revision)
+                quantize_onnx(fp32_path, onnx_path)
+        elif not os.path.exists(onnx_path):
+            export_onnx(model_name, onnx_path, revision=revision)
+
+        options = ort.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            onnx_path, options, providers=["CPUExecutionProvider"]
+        )
+        self.logger.info(f"Loaded ONNX encoder from {onnx_path}")
+
+    def tokenize(self, texts):
+        return self.tokenizer(
+            list(texts),
+            return_tensors="np",
+            truncation=True,
+            padding=True,
+            max_length=self.max_length,
+        )
+
+    def forward(self, tokens):
+        """Run the model on tokenized input, returning [CLS] vectors"""
+        inputs = {
+            "input_ids": tokens["input_ids"].astype(np.int64),
+            "attention_mask": tokens["attention_mask"].astype(np.int64),
+        }
+        return self.session.run(["cls"], inputs)[0]
+
+    def encode(self, texts):
+        """Return the [CLS] embeddings of ``texts`` as a (n, hidden) float32 array"""
+        return self.forward(self.tokenize(texts))
+
+
+def export_onnx(model_name, onnx_path, revision="main"):
+    """Export the [CLS] output of ``model_name`` to an ONNX file"""
+    logger = logging.getLogger(__name__)
+    logger.info(f"Exporting {model_name} to ONNX at {onnx_path}...")
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name, revision=revision)
+    model = _ClsModel(AutoModel.from_pretrained(model_name, revision=revision).eval())
+    sample = tokenizer(PARITY_TEXTS, return_tensors="pt", padding=True)
+
+    os.makedirs(os.path.dirname(onnx_path) or ".", exist_ok=True)
+    torch.onnx.export(
+        model,
+        (sample["input_ids"], sample["attention_mask"]),
+        onnx_path,
+        input_names=["input_ids", "attention_mask"],
+        output_names=["cls"],
+        dynamic_axes={
+            "input_ids": {0: "batch", 1: "sequence"},
+            "attention_mask": {0: "batch", 1: "sequence"},
+            "cls": {0: "batch"},
+        },
+        opset_version=18,
+    )
+    return onnx_path
+
+
+def quantize_onnx(fp32_path, int8_path):
+    """Apply ONNX Runtime dynamic int8 quantization to an exported model"""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    logging.getLogger(__name__).info(f"Quantizing {fp32_path} to {int8_path}...")
+    quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+    return int8_path
+
+
+def create_encoder(
+    backend, model_name, revision="main", num_threads=0, onnx_path=None, max_length=512
+):
+    """Build the encoder selected by ``backend`` (one of ``BACKENDS``)"""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown encoder backend {backend!r}, expected one of {BACKENDS}")
+
+    quantize = backend.endswith("-int8")
+    if backend.startswith("onnx"):
+        if not onnx_path:
+            raise ValueError("onnx_path is required for ONNX encoder backends")
+        return OnnxEncoder(
+            model_name,
+            onnx_path,
+            revision=revision,
+            num_threads=num_threads,
+            quantize=quantize,
+            max_length=max_length,
+        )
+    return TorchEncoder(
+        model_name,
+        revision=revision,
+        num_threads=num_threads,
+        quantize=quantize,
+        max_length=max_length,
+    )
+
+
+def length_buckets(encoder, texts, max_batch_size=32, bucket_width=32):
+    """Group indices of ``texts`` into batches of similar token length.
+
+    Texts are sorted by token count and split whenever a batch reaches
+    ``max_batch_size`` or crosses a ``bucket_width`` boundary, so padding
+    inside each batch stays small.
+    """
+    lengths = [
+        len(ids)
+        for ids in encoder.tokenizer(
+            list(texts), truncation=True, max_length=encoder.max_length
+        )["input_ids"]
+    ]
+    order = sorted(range(len(lengths)), key=lengths.__getitem__)
+
+    batches, batch, bucket = [], [], None
+    for i in order:
+        current = (lengths[i] - 1) // bucket_width
+        if batch and (len(batch) >= max_batch_size or current != bucket):
+            batches.append(batch)
+            batch = []
+        batch.append(i)
+        bucket = current
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def encode_bucketed(encoder, texts, max_batch_size=32, bucket_width=32):
+    """Encode ``texts`` with one padded forward pass per length bucket.
+
+    Returns a (n, hidden) float32 array in the original order of ``texts``.
+    """
+    texts = list(texts)
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+
+    vectors = None
+    for indices in length_buckets(encoder, texts, max_batch_size, bucket_width):
+        batch_vectors = encoder.encode([texts[i] for i in indices])
+        if vectors is None:
+            vectors = np.empty((len(texts), batch_vectors.shape[1]), dtype=np.float32)
+        vectors[indices] = batch_vectors
+    return vectors
+
+
+def check_parity(reference, candidate, texts=PARITY_TEXTS, min_cosine=0.99):
+    """Compare [CLS] vectors of ``candidate`` against the fp32 ``reference``.
+
+    Returns ``(ok, max_abs_diff, min_cosine_similarity)``.
+    """
+    expected = reference.encode(texts).astype(np.float64)
+    actual = candidate.encode(texts).astype(np.float64)
+
+    max_abs_diff = float(np.abs(expected - actual).max())
+    cosine = (expected * actual).sum(axis=1) / (
+        np.linalg.norm(expected, axis=1) * np.linalg.norm(actual, axis=1)
+    )
+    worst = float(cosine.min())
+    return worst >= min_cosine, max_abs_diff, worst
+
+
+def main():
+    from inference_service.config.config import ModelConfig
+    from inference_service.utils.logging_utils import setup_logging
+
+    setup_logging()
+    logger = logging.getLogger(__name__)
+    config = ModelConfig()
+
+    parser = argparse.ArgumentParser(description="Export and verify encoder backends")
+    parser.add_argument("--backend", default=config.ENCODER_BACKEND, choices=BACKENDS)
+    parser.add_argument("--onnx-path", default=config.ONNX_MODEL_PATH)
+    parser.add_argument("--threads", default=config.ENCODER_THREADS, type=int)
+    parser.add_argument("--min-cosine", default=config.ENCODER_MIN_COSINE, type=float)
+    args = parser.parse_args()
+
+    candidate = create_encoder(
+        args.backend,
+        config.BERT_MODEL_PATH,
+        revision=config.BERT_MODEL_REVISION,
+        num_threads=args.threads,
+        onnx_path=args.onnx_path,
+    )
+    reference = TorchEncoder(config.BERT_MODEL_PATH, revision=config.BERT_MODEL_REVISION)
+
+    ok, max_abs_diff, cosine = check_parity(reference, candidate, min_cosine=args.min_cosine)
+    logger.info(
+        f"Parity {args.backend}: max abs diff {max_abs_diff:.6f}, "
+        f"min cosine {cosine:.6f} -> {'OK' if ok else 'FAILED'}"
+    )
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
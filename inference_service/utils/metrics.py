@@ -0,0 +1,81 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+# Embedding cache metrics
+EMBEDDING_CACHE_HITS = Counter(
+    'embedding_cache_hits_total',
+    'Number of embedding cache hits by tier',
+    ['tier']  # "memory" or "redis"
+)
+
+EMBEDDING_CACHE_MISSES = Counter(
+    'embedding_cache_misses_total',
+    'Number of embeddings that had to be computed'
+)
+
+EMBEDDING_CACHE_EVICTIONS = Counter(
+    'embedding_cache_evictions_total',
+    'Number of embeddings evicted from the in-process LRU tier'
+)
+
+# Inference server admission metrics
+INFERENCE_IN_FLIGHT = Gauge(
+    'inference_in_flight_requests',
+    'Number of requests currently being executed by the model'
+)
+
+INFERENCE_QUEUE_DEPTH = Gauge(
+    'inference_queue_depth',
+    'Number of admitted requests waiting for an execution slot'
+)
+
+INFERENCE_REJECTED = Counter(
+    'inference_rejected_total',
+    'Number of requests rejected with RESOURCE_EXHAUSTED',
+    ['method']
+)
+
+# Inference request metrics
+INFERENCE_REQUEST_TIME = Histogram(
+    'inference_request_seconds',
+    'End-to-end time spent handling an inference RPC',
+    ['method'],
+    buckets=[.005, .01, .025, .05, .1, .25, .5, 1.0, 2.5, 5.0, 10.0]
+)
+
+INFERENCE_ERRORS = Counter(
+    'inference_errors_total',
+    'Number of failed inference RPCs by gRPC status code',
+    ['method', 'code']
+)
+
+INFERENCE_STAGE_TIME = Histogram(
+    'inference_stage_seconds',
+    'Time spent in each stage of the inference path',
+    ['stage'],  # tokenize, encode, classify, serialize
+    buckets=[.0005, .001, .0025, .005, .01, .025, .05, .1, .25, .5, 1.0, 2.5]
+)
+
+INFERENCE_BATCH_SIZE = Histogram(
+    'inference_batch_size',
+    'Number of texts per model batch',
+    buckets=[1, 2, 4, 8, 16, 32, 64, 128, 256]
+)
+
+INFERENCE_QUEUE_WAIT_TIME = Histogram(
+    'inference_queue_wait_seconds',
+    'Time a request waits in the batcher queue before its batch runs',
+    buckets=[.0005, .001, .0025, .005, .01, .025, .05, .1, .25, .5, 1.0]
+)
+
+# Model version metrics
+INFERENCE_MODEL_VERSION = Gauge(
+    'inference_model_version_info',
+    'Classifier model version currently serving traffic (1 = active)',
+    ['version']
+)
+
+INFERENCE_MODEL_RELOADS = Counter(
+    'inference_model_reloads_total',
+    'Number of classifier hot reloads by result',
+    ['result']
+)
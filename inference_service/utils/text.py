@@ -0,0 +1,10 @@
+import unicodedata
+
+
+def normalize_text(text):
+    """Normalize text so trivially different copies of a review compare equal.
+
+    Shared by the embedding cache keys and scraper post hashes, so this module
+    must stay free of third-party imports.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
@@ -0,0 +1,38 @@
+import struct
+
+import numpy as np
+
+# Header: format version, dtype code, reserved, dimension (little endian, 8 bytes)
+_HEADER = struct.Struct("<BBHI")
+_VERSION = 1
+
+VECTOR_DTYPES = {"float32": 1, "float16": 2}
+_DTYPE_BY_CODE = {
+    code: np.dtype(name).newbyteorder("<") for name, code in VECTOR_DTYPES.items()
+}
+
+
+def encode_vector(vector, dtype="float32"):
+    """Pack a 1-d vector into bytes with a dimension and dtype header.
+
+    Stored as-is by pymongo, the result becomes a compact BSON binary field.
+    """
+    if dtype not in VECTOR_DTYPES:
+        raise ValueError(f"Unknown vector dtype {dtype!r}, expected one of {tuple(VECTOR_DTYPES)}")
+    array = np.asarray(vector, dtype=_DTYPE_BY_CODE[VECTOR_DTYPES[dtype]]).ravel()
+    return _HEADER.pack(_VERSION, VECTOR_DTYPES[dtype], 0, array.size) + array.tobytes()
+
+
+def decode_vector(data):
+    """Return the vector stored in ``data`` as a read-only array without copying.
+
+    Plain lists of floats, the format used before binary vectors, are
+    converted to float32.
+    """
+    if isinstance(data, (list, tuple)):
+        return np.asarray(data, dtype=np.float32)
+
+    version, code, _, dim = _HEADER.unpack_from(data)
+    if version != _VERSION or code not in _DTYPE_BY_CODE:
+        raise ValueError(f"Unsupported vector encoding (version {version}, dtype {code})")
+    return np.frombuffer(data, dtype=_DTYPE_BY_CODE[code], count=dim, offset=_HEADER.size)
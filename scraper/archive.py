@@ -0,0 +1,163 @@
+# scraper/archive.py
+"""
+Record the raw responses of a crawl into a local archive and replay them.
+In record mode every response is stored gzip-compressed, keyed by request
+method and URL. In replay mode the spider is served entirely from the
+archive, without network access, login credentials or politeness delays.
+"""
+import os
+import gzip
+import json
+import hashlib
+import logging
+import tempfile
+from datetime import datetime
+from scrapy.exceptions import IgnoreRequest, NotConfigured
+from scrapy.http import Headers
+from scrapy.responsetypes import responsetypes
+
+# Crawl settings applied over the spider's own settings when replaying
+REPLAY_SETTINGS = {
+    "DOWNLOAD_DELAY": 0,
+    "AUTOTHROTTLE_ENABLED": False,
+    "ADAPTIVE_CONCURRENCY_ENABLED": False,
+    "CONCURRENT_REQUESTS": 64,
+    "CONCURRENT_REQUESTS_PER_DOMAIN": 64,
+    "CRAWL_RATE_LIMIT": 0,
+    # Every archived page has to be parsed again
+    "RESPONSE_CACHE_ENABLED": False,
+}
+
+# Session cookies are never written to the archive
+SKIPPED_HEADERS = {b"set-cookie"}
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseArchive:
+    """
+    Directory of recorded responses, one gzip file per request key.
+    Each file holds a JSON header line (URL, status, headers) followed by the body.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    @staticmethod
+    def key(method, url):
+        # Form posts are keyed without their body, so replays work with any credentials
+        return hashlib.sha1(f"{method.upper()} {url}".encode("utf-8")).hexdigest()
+
+    def file_path(self, method, url):
+        key = self.key(method, url)
+        return os.path.join(self.path, key[:2], f"{key}.gz")
+
+    def save(self, method, url, status, headers, body, extra=None):
+        path = self.file_path(method, url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        meta = {
+            **(extra or {}),
+            "method": method.upper(),
+            "url": url,
+            "status": status,
+            "headers": headers,
+            "recorded_at": datetime.now().isoformat(),
+        }
+        # Write then rename, so concurrent crawls never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as f:
+                f.write(json.dumps(meta).encode("utf-8") + b"\n")
+                f.write(body)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, method, url):
+        """Return ``(meta, body)`` of a recorded response, or None"""
+        try:
+            with gzip.open(self.file_path(method, url), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        header, _, body = data.partition(b"\n")
+        return json.loads(header), body
+
+    def entries(self):
+        """Iterate over every recorded ``(meta, body)``"""
+        for dirpath, _, filenames in os.walk(self.path):
+            for filename in sorted(filenames):
+                if not filename.endswith(".gz"):
+                    continue
+                with gzip.open(os.path.join(dirpath, filename), "rb") as f:
+                    header, _, body = f.read().partition(b"\n")
+                yield json.loads(header), body
+
+
+def archived_headers(response, skipped=SKIPPED_HEADERS):
+    return {
+        name.decode("latin-1"): [value.decode("latin-1") for value in values]
+        for name, values in response.headers.items()
+        if name.lower() not in skipped
+    }
+
+
+def archived_response(request, meta, body, flags=None):
+    """Rebuild the response to ``request`` from an archive entry"""
+    headers = Headers(meta["headers"], encoding="latin-1")
+    response_cls = responsetypes.from_args(headers=headers, url=request.url, body=body)
+    return response_cls(
+        url=request.url,
+        status=meta["status"],
+        headers=headers,
+        body=body,
+        request=request,
+        flags=flags,
+    )
+
+
+class ArchiveMiddleware:
+    """
+    Downloader middleware recording responses to, or replaying them from,
+    ARCHIVE_DIR depending on ARCHIVE_MODE ("record" or "replay").
+    It sits next to the downloader, so redirects, cookies and decompression
+    are handled as usual on recorded and replayed responses alike.
+    """
+
+    def __init__(self, archive, mode, stats):
+        self.archive = archive
+        self.mode = mode
+        self.stats = stats
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        mode = crawler.settings.get("ARCHIVE_MODE")
+        if mode not in ("record", "replay"):
+            raise NotConfigured
+        path = crawler.settings.get("ARCHIVE_DIR")
+        if not path:
+            raise NotConfigured("ARCHIVE_DIR is not set")
+        logger.info(f"Archive {mode} mode using {path}")
+        return cls(ResponseArchive(path), mode, crawler.stats)
+
+    def process_request(self, request, spider=None):
+        if self.mode != "replay":
+            return None
+        entry = self.archive.load(request.method, request.url)
+        if entry is None:
+            self.stats.inc_value("archive/missing")
+            raise IgnoreRequest(f"Not in archive: {request.method} {request.url}")
+        self.stats.inc_value("archive/replayed")
+        return archived_response(request, *entry, flags=["archived"])
+
+    def process_response(self, request, response, spider=None):
+        if self.mode != "record":
+            return response
+        try:
+            self.archive.save(request.method, request.url, response.status,
+                              archived_headers(response), response.body)
+            self.stats.inc_value("archive/recorded")
+        except OSError as e:
+            logger.error(f"Error archiving {request.url}: {str(e)}")
+        return response
@@ -0,0 +1,120 @@
+# scraper/benchmark_extraction.py
+"""
+Micro-benchmark of topic page extraction over saved pages.
+Compares the previous per-field Selector extraction with scraper.extraction
+and checks that both produce the same records:
+
+    python -m scraper.benchmark_extraction crawl_archive
+    python -m scraper.benchmark_extraction saved_pages/ --repeat 20
+"""
+import os
+import sys
+import time
+import argparse
+from datetime import datetime
+from scrapy.http import HtmlResponse
+
+from scraper.archive import ResponseArchive
+from scraper.extraction import topic_posts, extract_post
+
+
+def load_pages(path):
+    """Topic pages from a response archive, or from a directory of .html files"""
+    pages = []
+    if any(name.endswith(".html") for name in os.listdir(path)):
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".html"):
+                with open(os.path.join(path, name), "rb") as f:
+                    pages.append((f"https://polwro.com/{name}", f.read()))
+        return pages
+    for meta, body in ResponseArchive(path).entries():
+        if meta["status"] == 200 and "/t," in meta["url"]:
+            pages.append((meta["url"], body))
+    return pages
+
+
+def selector_extract(response):
+    """The previous parse_topic extraction, one Selector query per field"""
+    records = []
+    for post in response.css('ul.gradient_post'):
+        post_date_str = post.css('div.post_date::text').re_first(r'(\d{4}-\d{2}-\d{2},\s*\d{2}:\d{2})(?:,\s*)?')
+        post_date = datetime.strptime(post_date_str, '%Y-%m-%d, %H:%M') if post_date_str else None
+        user_data = {
+            'username': post.css('span[itemprop="author"]::text').get('').strip(),
+            'faculty': post.css('div.ll::text').re_first(r'Wydział:\s*(.*?)(?:\s{2,}|\n|$)'),
+            'year': post.css('div.ll::text').re_first(r'Rok studiów:\s*(\d+)'),
+            'opinion_weight': post.css('span.important_inline::text').re_first(r'Waga opinii: x([\d.]+)'),
+        }
+        if user_data['opinion_weight']:
+            user_data['opinion_weight'] = float(user_data['opinion_weight'])
+        professor_name = ' '.join([
+            post.css('span[itemprop="givenName"]::text').get(''),
+            post.css('span[itemprop="familyName"]::text').get('')
+        ]).strip()
+        vote_rate = post.css('span.vote_rate::text').get('')
+        rating = post.css('span[itemprop="ratingValue"]::text').get('')
+        content = post.css('span[itemprop="reviewBody"]')
+        course_name = content.css('span[style="font-weight: bold"]::text').re_first(r'Kurs: (.*?)(?:\s{2,}|\n|$)')
+        review_text = content.css('::text').getall()
+        records.append({
+            **user_data,
+            "date": post_date,
+            "professor": professor_name,
+            "rating": rating,
+            "vote_rate": float(vote_rate.strip()) if vote_rate and vote_rate.strip() else None,
+            "course": course_name,
+            "review": " ".join(review_text).strip(),
+            "post_url": response.url,
+            "language": None,
+        })
+    return records
+
+
+def lxml_extract(response):
+    return [extract_post(post, response.url) for post in topic_posts(response.selector.root)]
+
+
+def measure(extract, responses, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for response in responses:
+            extract(response)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark topic page extraction")
+    parser.add_argument("path", help="Response archive or directory of saved .html topic pages")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per implementation, the best is reported")
+    args = parser.parse_args(argv)
+
+    pages = load_pages(args.path)
+    if not pages:
+        print(f"No topic pages found in {args.path}")
+        return 1
+    responses = [HtmlResponse(url=url, body=body, encoding="utf-8") for url, body in pages]
+
+    # Parse every page up front, the spider pays this once per page either way
+    start = time.perf_counter()
+    for response in responses:
+        response.selector
+    parse_time = time.perf_counter() - start
+
+    mismatches = sum(selector_extract(response) != lxml_extract(response) for response in responses)
+    posts = sum(len(lxml_extract(response)) for response in responses)
+
+    selector_time = measure(selector_extract, responses, args.repeat)
+    lxml_time = measure(lxml_extract, responses, args.repeat)
+
+    print(f"{len(responses)} pages, {posts} posts, HTML parsing {parse_time * 1000:.1f} ms")
+    for name, elapsed in (("selectors", selector_time), ("extraction", lxml_time)):
+        print(f"{name:>10}: {elapsed * 1000:8.1f} ms total, "
+              f"{elapsed / len(responses) * 1e6:8.1f} us/page, {elapsed / max(posts, 1) * 1e6:6.1f} us/post")
+    print(f"speedup: {selector_time / lxml_time:.1f}x, pages with different records: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+# scraper/crawl.py
+"""
+Run a single PolWro crawl in its own process.
+The Twisted reactor cannot be restarted, so run_polwro_scraper launches every
+crawl, including retries, as ``python -m scraper.crawl`` in a fresh process.
+"""
+import os
+import sys
+import argparse
+import logging
+from scrapy.crawler import CrawlerProcess
+from scraper.polwro_scraper import PolwroSpider
+from scraper.sharding import load_crawl_plan, save_crawl_plan
+
+CRAWL_MAX_RATE = float(os.getenv("CRAWL_MAX_RATE", 4))
+
+logger = logging.getLogger(__name__)
+
+
+def crawl_settings(full_scan=True, archive_mode=None, archive_dir=None):
+    return {
+        "USER_AGENT": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        "LOG_LEVEL": "WARNING",  # Set to WARNING to reduce log verbosity
+        # Politeness ceiling of the adaptive controller in requests per second,
+        # be more conservative during full scan
+        "ADAPTIVE_MAX_RATE": CRAWL_MAX_RATE / 2 if full_scan else CRAWL_MAX_RATE,
+        # Requests per second for the whole site, shared by all crawl processes (0 = off)
+        "CRAWL_RATE_LIMIT": float(os.getenv("CRAWL_RATE_LIMIT", 0)),
+        # "record" saves every response to ARCHIVE_DIR, "replay" crawls from it offline
+        "ARCHIVE_MODE": archive_mode,
+        "ARCHIVE_DIR": archive_dir,
+        # Conditional requests and skipping of unchanged pages; recordings need full responses
+        "RESPONSE_CACHE_ENABLED": archive_mode is None and os.getenv("CRAWL_RESPONSE_CACHE", "1") == "1",
+        "RESPONSE_CACHE_DIR": os.getenv("CRAWL_RESPONSE_CACHE_DIR", "http_cache"),
+    }
+
+
+def run_crawl(full_scan=True, job_id=None, run_id=None, forum_url=None, enumerate_only=False,
+              archive_mode=None, archive_dir=None):
+    """
+    Run the spider to completion, returns True when it finished cleanly.
+    With ``enumerate_only`` the spider only logs in and stores the crawl plan of
+    ``run_id``; with ``forum_url`` it crawls that forum as a shard of ``run_id``.
+    ``archive_mode`` "record" or "replay" records the crawl into, or replays it
+    from, the response archive in ``archive_dir``.
+    """
+    archive_mode = archive_mode or os.getenv("CRAWL_ARCHIVE_MODE")
+    archive_dir = archive_dir or os.getenv("CRAWL_ARCHIVE_DIR", "crawl_archive")
+
+    # Load credentials from environment variables
+    login = os.getenv('POLWRO_USERNAME')
+    password = os.getenv('POLWRO_PASSWORD')
+
+    if archive_mode == "replay":
+        # The archived login response is served whatever the credentials
+        login, password = login or "replay", password or "replay"
+    elif not login or not password:
+        raise ValueError("Missing POLWRO_USERNAME or POLWRO_PASSWORD environment variables")
+
+    cookies = load_crawl_plan(run_id).get("cookies") if forum_url and run_id else None
+
+    process = CrawlerProcess(crawl_settings(full_scan, archive_mode, archive_dir))
+    crawler = process.create_crawler(PolwroSpider)
+    process.crawl(crawler,
+                 login=login,
+                 password=password,
+                 full_scan=full_scan,
+                 job_id=job_id,
+                 forum_url=forum_url,
+                 cookies=cookies,
+                 run_id=run_id,
+                 enumerate_only=enumerate_only)
+    process.start()
+
+    reason = crawler.stats.get_value("finish_reason")
+    logger.info(f"Crawl job {job_id} closed: {reason}")
+
+    if enumerate_only:
+        spider = crawler.spider
+        if not spider.forum_urls:
+            logger.error("No forums found, login or forum index failed")
+            return False
+        save_crawl_plan(run_id, spider.forum_urls, spider.session_cookies)
+        logger.info(f"Crawl plan {run_id}: {len(spider.forum_urls)} forums")
+    return reason == "finished"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run one PolWro crawl")
+    parser.add_argument("--incremental", action="store_true", help="Only crawl changed topics")
+    parser.add_argument("--job-id", default=None, help="Resumable crawl job identifier")
+    parser.add_argument("--run-id", default=None, help="Sharded run sharing a crawl plan and seen-set")
+    parser.add_argument("--enumerate", action="store_true", help="Only store the crawl plan of --run-id")
+    parser.add_argument("--forum-url", default=None, help="Crawl a single forum as a shard of --run-id")
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument("--record", metavar="DIR", default=None, help="Save every response to an archive")
+    archive.add_argument("--replay", metavar="DIR", default=None, help="Crawl offline from an archive")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    finished = run_crawl(
+        full_scan=not args.incremental,
+        job_id=args.job_id,
+        run_id=args.run_id,
+        forum_url=args.forum_url,
+        enumerate_only=args.enumerate,
+        archive_mode="record" if args.record else "replay" if args.replay else None,
+        archive_dir=args.record or args.replay,
+    )
+    return 0 if finished else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+# scraper/crawl_state.py
+import hashlib
+import logging
+from datetime import datetime
+
+
+class CrawlState:
+    """
+    Per-topic crawl state kept in the ``crawl_state`` collection.
+    Each topic stores a signature of its forum listing entry (last post date, reply
+    count) and the last topic page fetched, so incremental runs can skip topics
+    that did not change and resume changed ones from their last page.
+    """
+
+    def __init__(self, db, collection="crawl_state"):
+        self.logger = logging.getLogger(__name__)
+        self.collection = db[collection]
+        self.topics = {
+            document["_id"]: document
+            for document in self.collection.find({}, {"signature": 1, "last_page_url": 1})
+        }
+        self.logger.info(f"Loaded crawl state for {len(self.topics)} topics")
+
+    @staticmethod
+    def signature(reply_count, last_post):
+        """
+        Hash of a topic's reply count and last post date, it changes whenever
+        a reply is posted. None if the listing entry showed neither.
+        """
+        if reply_count is None and last_post is None:
+            return None
+        fields = f"{reply_count}|{last_post.isoformat() if last_post else ''}"
+        return hashlib.sha1(fields.encode("utf-8")).hexdigest()
+
+    def is_unchanged(self, topic_url, signature):
+        state = self.topics.get(topic_url)
+        return state is not None and state.get("signature") == signature
+
+    def resume_url(self, topic_url):
+        """URL of the last fetched page of a known topic, or the topic itself"""
+        state = self.topics.get(topic_url)
+        return (state or {}).get("last_page_url") or topic_url
+
+    def mark(self, topic_url, signature, last_page_url):
+        """Record a fully crawled topic"""
+        state = {"signature": signature, "last_page_url": last_page_url}
+        self.collection.update_one(
+            {"_id": topic_url},
+            {"$set": {**state, "updated_at": datetime.now()}},
+            upsert=True,
+        )
+        self.topics[topic_url] = {"_id": topic_url, **state}
@@ -0,0 +1,161 @@
+# scraper/daemon.py
+"""
+Long-lived crawler service.
+Keeps one Twisted reactor and the PolWro login session alive and runs the
+crawl jobs queued with scraper.jobs.submit_crawl_job one after another, so a
+scheduled crawl starts immediately instead of paying for a new process,
+Scrapy import and login every time:
+
+    python -m scraper.daemon
+"""
+import os
+import sys
+import json
+import time
+import logging
+from datetime import datetime
+
+from scrapy.utils.reactor import install_reactor
+
+# Scrapy expects the asyncio reactor, it has to be installed before anything imports one
+install_reactor("twisted.internet.asyncioreactor.AsyncioSelectorReactor")
+
+from twisted.internet import defer, reactor, task
+from twisted.internet.threads import deferToThread
+from scrapy.crawler import CrawlerRunner
+from scrapy.utils.log import configure_logging
+
+from scraper.crawl import crawl_settings
+from scraper.jobs import CRAWL_JOBS_KEY, get_redis, set_job_status
+from scraper.metrics import CRAWL_JOBS, CRAWL_JOB_TIME
+from scraper.polwro_scraper import PolwroSpider
+
+# Seconds a BLPOP waits for a job before checking for shutdown
+POLL_TIMEOUT = 5
+
+# Runs of a job before it is given up, reruns resume from its crawl frontier
+CRAWL_DAEMON_MAX_ATTEMPTS = int(os.getenv("CRAWL_DAEMON_MAX_ATTEMPTS", 3))
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlerDaemon:
+    """Runs queued crawl jobs on a shared reactor, reusing the login session between jobs"""
+
+    def __init__(self, login, password, redis_client=None):
+        self.login = login
+        self.password = password
+        self.redis = redis_client or get_redis()
+        self.cookies = None
+        self.runner = None
+        self.running = True
+
+    async def serve(self):
+        logger.info("Crawler daemon waiting for jobs")
+        while self.running:
+            try:
+                item = await deferToThread(self.redis.blpop, [CRAWL_JOBS_KEY], POLL_TIMEOUT)
+            except Exception as e:
+                logger.error(f"Error reading the crawl job queue: {str(e)}")
+                await task.deferLater(reactor, POLL_TIMEOUT, lambda: None)
+                continue
+            if item is None:
+                continue
+            try:
+                job = json.loads(item[1])
+            except ValueError:
+                logger.error(f"Dropping malformed crawl job: {item[1]!r}")
+                continue
+            await self.run_job(job)
+
+    async def run_job(self, job):
+        job_id, mode, forum_url = job["job_id"], job.get("mode", "incremental"), job.get("forum_url")
+        attempt = job.get("attempt", 0) + 1
+        full_scan = mode == "full"
+        logger.info(f"Starting crawl job {job_id} ({mode}, attempt {attempt})")
+        set_job_status(self.redis, job_id, "running", attempt=attempt, started_at=datetime.now().isoformat())
+
+        start = time.monotonic()
+        self.runner = CrawlerRunner(crawl_settings(full_scan))
+        crawler = self.runner.create_crawler(PolwroSpider)
+        try:
+            await self.runner.crawl(
+                crawler,
+                login=self.login,
+                password=self.password,
+                full_scan=full_scan,
+                job_id=job_id,
+                forum_url=forum_url,
+                cookies=self.cookies,
+            )
+            reason = crawler.stats.get_value("finish_reason")
+        except Exception as e:
+            logger.error(f"Crawl job {job_id} failed: {str(e)}")
+            reason = "error"
+        finally:
+            self.runner = None
+        CRAWL_JOB_TIME.labels(mode=mode).observe(time.monotonic() - start)
+
+        spider = crawler.spider
+        if reason == "finished":
+            # Keep the session the spider ended with, it may have logged in again
+            if spider is not None and spider.session_cookies:
+                self.cookies = spider.session_cookies
+            CRAWL_JOBS.labels(mode=mode, result="finished").inc()
+            set_job_status(self.redis, job_id, "finished", finish_reason=reason,
+                           finished_at=datetime.now().isoformat())
+            logger.info(f"Crawl job {job_id} finished")
+            return
+
+        if not self.running:
+            # Interrupted by a shutdown, the next daemon resumes it without counting an attempt
+            set_job_status(self.redis, job_id, "queued", finish_reason=str(reason))
+            self.redis.rpush(CRAWL_JOBS_KEY, json.dumps(job))
+            logger.warning(f"Crawl job {job_id} interrupted by shutdown, queued again")
+            return
+
+        # The session may be the cause, the next run logs in from scratch
+        self.cookies = None
+        if attempt < CRAWL_DAEMON_MAX_ATTEMPTS:
+            CRAWL_JOBS.labels(mode=mode, result="retried").inc()
+            set_job_status(self.redis, job_id, "queued", finish_reason=str(reason))
+            self.redis.rpush(CRAWL_JOBS_KEY, json.dumps({**job, "attempt": attempt}))
+            logger.warning(f"Crawl job {job_id} closed with {reason}, queued again")
+        else:
+            CRAWL_JOBS.labels(mode=mode, result="failed").inc()
+            set_job_status(self.redis, job_id, "failed", finish_reason=str(reason),
+                           finished_at=datetime.now().isoformat())
+            logger.error(f"Crawl job {job_id} closed with {reason}, giving up")
+
+    def stop(self):
+        """Stop taking jobs and close a running crawl, its frontier lets it resume later"""
+        self.running = False
+        if self.runner is not None:
+            return self.runner.stop()
+        return None
+
+
+def main():
+    login = os.getenv('POLWRO_USERNAME')
+    password = os.getenv('POLWRO_PASSWORD')
+    if not login or not password:
+        raise ValueError("Missing POLWRO_USERNAME or POLWRO_PASSWORD environment variables")
+
+    configure_logging(install_root_handler=False)
+    logging.basicConfig(level=logging.INFO)
+
+    daemon = CrawlerDaemon(login, password)
+
+    def stopped(failure):
+        logger.error(f"Crawler daemon stopped: {failure.getErrorMessage()}")
+        if reactor.running:
+            reactor.stop()
+
+    reactor.addSystemEventTrigger("before", "shutdown", daemon.stop)
+    reactor.callWhenRunning(lambda: defer.ensureDeferred(daemon.serve()).addErrback(stopped))
+    reactor.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+# scraper/extraction.py
+"""
+Post extraction for PolWro topic pages.
+Works directly on the lxml tree the response was parsed into, with XPath
+expressions (translated from the spider's original CSS selectors) and
+regexes compiled once at import, instead of building Selector objects
+for every field of every post.
+"""
+import re
+from datetime import datetime
+from lxml import etree
+from parsel.csstranslator import HTMLTranslator
+
+_translator = HTMLTranslator()
+
+
+def _compile(css):
+    return etree.XPath(_translator.css_to_xpath(css), smart_strings=False)
+
+
+POSTS = _compile('ul.gradient_post')
+POST_DATE_TEXT = _compile('div.post_date::text')
+AUTHOR_TEXT = _compile('span[itemprop="author"]::text')
+USER_INFO_TEXT = _compile('div.ll::text')
+WEIGHT_TEXT = _compile('span.important_inline::text')
+GIVEN_NAME_TEXT = _compile('span[itemprop="givenName"]::text')
+FAMILY_NAME_TEXT = _compile('span[itemprop="familyName"]::text')
+VOTE_RATE_TEXT = _compile('span.vote_rate::text')
+RATING_TEXT = _compile('span[itemprop="ratingValue"]::text')
+REVIEW_BODY = _compile('span[itemprop="reviewBody"]')
+COURSE_TEXT = _compile('span[style="font-weight: bold"]::text')
+ALL_TEXT = _compile('::text')
+
+POST_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2}),\s*(\d{2}):(\d{2})')
+FACULTY_RE = re.compile(r'Wydział:\s*(.*?)(?:\s{2,}|\n|$)')
+YEAR_RE = re.compile(r'Rok studiów:\s*(\d+)')
+WEIGHT_RE = re.compile(r'Waga opinii: x([\d.]+)')
+COURSE_RE = re.compile(r'Kurs: (.*?)(?:\s{2,}|\n|$)')
+
+# Forum listing rows: cells of a row, and its reply count cell when the template marks it
+LISTING_CELLS = etree.XPath('./*', smart_strings=False)
+REPLY_COUNT_TEXT = _compile('.posts ::text, .replies ::text')
+COUNT_RE = re.compile(r'^\s*(\d+)\b')
+
+
+def _first(texts, default=''):
+    return texts[0] if texts else default
+
+
+def _search(regex, texts):
+    """First group of the first match in ``texts``, like Selector.re_first"""
+    for text in texts:
+        match = regex.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+
+def parse_post_date(texts):
+    """Parse the fixed 'YYYY-MM-DD, HH:MM' post date without strptime"""
+    for text in texts:
+        match = POST_DATE_RE.search(text)
+        if match:
+            return datetime(*map(int, match.groups()))
+    return None
+
+
+def listing_entry(row):
+    """
+    ``(reply count, last post date)`` of a topic's row in a forum listing.
+    The last post date is the latest date in the row. The reply count is read
+    from a cell marked as such, or else the first cell holding just a number,
+    replies being listed before views. Other text, such as the view counter
+    that changes on every visit, is left out.
+    """
+    dates = [datetime(*map(int, match)) for match in POST_DATE_RE.findall(''.join(ALL_TEXT(row)))]
+    last_post = max(dates) if dates else None
+
+    reply_count = None
+    match = COUNT_RE.match(''.join(REPLY_COUNT_TEXT(row)))
+    if match:
+        reply_count = int(match.group(1))
+    else:
+        for cell in LISTING_CELLS(row):
+            text = ''.join(ALL_TEXT(cell)).strip()
+            if text.isdigit():
+                reply_count = int(text)
+                break
+    return reply_count, last_post
+
+
+def topic_posts(root):
+    """Post elements of a topic page, ``root`` is the page's lxml tree"""
+    return POSTS(root)
+
+
+def post_date(post):
+    return parse_post_date(POST_DATE_TEXT(post))
+
+
+def extract_post(post, post_url, date=None):
+    """
+    Build the post_data record of one post element, its date is None when missing.
+    Pass ``date`` when it was already parsed, to filter posts before extracting them.
+    """
+    user_info = USER_INFO_TEXT(post)
+    opinion_weight = _search(WEIGHT_RE, WEIGHT_TEXT(post))
+
+    professor_name = ' '.join([
+        _first(GIVEN_NAME_TEXT(post)),
+        _first(FAMILY_NAME_TEXT(post)),
+    ]).strip()
+
+    course_name = None
+    review_text = []
+    for content in REVIEW_BODY(post):
+        if course_name is None:
+            course_name = _search(COURSE_RE, COURSE_TEXT(content))
+        review_text.extend(ALL_TEXT(content))
+
+    vote_rate = _first(VOTE_RATE_TEXT(post)).strip()
+
+    return {
+        'username': _first(AUTHOR_TEXT(post)).strip(),
+        'faculty': _search(FACULTY_RE, user_info),
+        'year': _search(YEAR_RE, user_info),
+        'opinion_weight': float(opinion_weight) if opinion_weight else opinion_weight,
+        "date": date or post_date(post),
+        "professor": professor_name,
+        "rating": _first(RATING_TEXT(post)),
+        "vote_rate": float(vote_rate) if vote_rate else None,
+        "course": course_name,
+        "review": " ".join(review_text).strip(),
+        "post_url": post_url,
+        "language": None,  # Will be filled by detect_language task
+    }
@@ -0,0 +1,208 @@
+# scraper/frontier.py
+import os
+import logging
+from datetime import datetime
+from pymongo import ASCENDING, UpdateOne
+from scrapy import Request, signals
+
+# Spider callbacks whose requests are checkpointed; login requests are always replayed
+TRACKED_CALLBACKS = {"parse_forums", "parse_forum", "parse_topic"}
+
+# Resumes a pending request gets before it is given up on, e.g. a page that always errors
+FRONTIER_MAX_ATTEMPTS = int(os.getenv("CRAWL_FRONTIER_MAX_ATTEMPTS", 3))
+
+
+class CrawlFrontier:
+    """
+    Persistent crawl frontier and seen-URL set of one crawl job, kept in Mongo.
+    Requests are recorded as pending when scheduled and marked done once their
+    response has been parsed and its posts published, so a restarted job can continue from the pending
+    requests instead of starting over. A job that finished with nothing left
+    pending clears its entries.
+    """
+
+    def __init__(self, db, job_id, collection="crawl_frontier", max_attempts=FRONTIER_MAX_ATTEMPTS):
+        self.logger = logging.getLogger(__name__)
+        self.job_id = job_id
+        self.max_attempts = max_attempts
+        self.collection = db[collection]
+        self.collection.create_index([("job_id", ASCENDING), ("url", ASCENDING)], unique=True)
+        self.collection.create_index([("job_id", ASCENDING), ("status", ASCENDING)])
+
+    def pending(self):
+        """
+        Pending entries left behind by an earlier run of this job, to resume.
+        Every call counts an attempt; entries resumed ``max_attempts`` times
+        without completing are marked failed and no longer returned.
+        """
+        query = {"job_id": self.job_id, "status": "pending"}
+        exhausted = {**query, "attempts": {"$gte": self.max_attempts}}
+        failed = [document["url"] for document in self.collection.find(exhausted, {"url": 1})]
+        if failed:
+            self.collection.update_many(exhausted, {"$set": {"status": "failed", "updated_at": datetime.now()}})
+            self.logger.warning(
+                f"Crawl job {self.job_id} gave up on {len(failed)} requests after "
+                f"{self.max_attempts} attempts: {', '.join(failed[:10])}"
+            )
+        self.collection.update_many(query, {"$inc": {"attempts": 1}})
+        return list(self.collection.find(query))
+
+    def has_pending(self):
+        return self.collection.count_documents({"job_id": self.job_id, "status": "pending"}, limit=1) > 0
+
+    def add(self, requests):
+        """
+        Record ``requests`` as pending and return the ones not already done.
+        One round trip to check and one bulk upsert per parsed response.
+        """
+        if not requests:
+            return []
+        urls = [request.url for request in requests]
+        done = {
+            document["url"]
+            for document in self.collection.find(
+                {"job_id": self.job_id, "url": {"$in": urls}, "status": "done"}, {"url": 1}
+            )
+        }
+        fresh = [request for request in requests if request.url not in done]
+        if fresh:
+            self.collection.bulk_write(
+                [
+                    UpdateOne(
+                        {"job_id": self.job_id, "url": request.url},
+                        {"$setOnInsert": {
+                            "status": "pending",
+                            "callback": request.callback.__name__,
+                            "meta": {key: request.meta.get(key) for key in ("topic_url", "listing_signature")},
+                            "created_at": datetime.now(),
+                        }},
+                        upsert=True,
+                    )
+                    for request in fresh
+                ],
+                ordered=False,
+            )
+        return fresh
+
+    def complete(self, url):
+        self.collection.update_one(
+            {"job_id": self.job_id, "url": url},
+            {"$set": {"status": "done", "updated_at": datetime.now()}},
+            upsert=True,
+        )
+
+    def clear(self):
+        result = self.collection.delete_many({"job_id": self.job_id})
+        self.logger.info(f"Crawl job {self.job_id} finished, cleared {result.deleted_count} frontier entries")
+
+
+class FrontierMiddleware:
+    """
+    Spider middleware checkpointing tracked requests into ``spider.frontier``.
+    Child requests are recorded before their parent is marked done, so a crash
+    never loses part of the frontier. With a ``spider.publish_tracker`` the
+    parent is only marked done once TaskPublishPipeline has published its
+    items, so posts still in the pipeline are not lost either.
+    """
+
+    def __init__(self, crawler):
+        self.crawler = crawler
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        middleware = cls(crawler)
+        crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        return middleware
+
+    def process_spider_output(self, response, result, spider):
+        if getattr(spider, "frontier", None) is None and getattr(spider, "publish_tracker", None) is None:
+            yield from result
+            return
+
+        requests = []
+        try:
+            for output in result:
+                if self.is_tracked(output):
+                    requests.append(output)
+                else:
+                    self.track_item(response, output, spider)
+                    yield output
+        except Exception:
+            self.discard(response, spider)
+            raise
+        yield from self.checkpoint(response, requests, spider)
+
+    async def process_spider_output_async(self, response, result, spider=None):
+        # Same as process_spider_output, for async callbacks such as Spider.start
+        spider = spider or self.crawler.spider
+        if getattr(spider, "frontier", None) is None and getattr(spider, "publish_tracker", None) is None:
+            async for output in result:
+                yield output
+            return
+
+        requests = []
+        try:
+            async for output in result:
+                if self.is_tracked(output):
+                    requests.append(output)
+                else:
+                    self.track_item(response, output, spider)
+                    yield output
+        except Exception:
+            self.discard(response, spider)
+            raise
+        for request in self.checkpoint(response, requests, spider):
+            yield request
+
+    @staticmethod
+    def is_tracked(output):
+        return getattr(getattr(output, "callback", None), "__name__", None) in TRACKED_CALLBACKS
+
+    @staticmethod
+    def track_item(response, output, spider):
+        tracker = getattr(spider, "publish_tracker", None)
+        if tracker is not None and response is not None and output is not None and not isinstance(output, Request):
+            tracker.add_item(response.request, output)
+
+    @staticmethod
+    def discard(response, spider):
+        tracker = getattr(spider, "publish_tracker", None)
+        if tracker is not None and response is not None:
+            tracker.discard(response.request)
+
+    def checkpoint(self, response, requests, spider):
+        """
+        Record ``requests`` as pending and mark ``response`` done once its items
+        are published, returns the requests to schedule
+        """
+        frontier = getattr(spider, "frontier", None)
+        tracker = getattr(spider, "publish_tracker", None)
+        if frontier is not None:
+            try:
+                requests = frontier.add(requests)
+                if response is not None and getattr(response.request.callback, "__name__", None) in TRACKED_CALLBACKS:
+                    # Entries are keyed by the URL originally requested, before redirects
+                    url = response.meta.get("redirect_urls", [response.url])[0]
+                    if tracker is not None:
+                        tracker.when_published(response.request, lambda: frontier.complete(url))
+                    else:
+                        frontier.complete(url)
+            except Exception as e:
+                spider.logger.error(f"Error checkpointing crawl frontier for {getattr(response, 'url', 'start')}: {e}")
+        if tracker is not None and response is not None:
+            tracker.parsed(response.request)
+        return requests
+
+    def spider_closed(self, spider, reason):
+        frontier = getattr(spider, "frontier", None)
+        if frontier is not None and reason == "finished":
+            try:
+                # Pages that errored or whose posts were not published are still pending
+                if frontier.has_pending():
+                    spider.logger.warning(
+                        f"Crawl job {frontier.job_id} left requests pending, keeping its frontier to resume them"
+                    )
+                else:
+                    frontier.clear()
+            except Exception as e:
+                spider.logger.error(f"Error clearing crawl frontier: {e}")
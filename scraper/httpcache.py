@@ -0,0 +1,135 @@
+# scraper/httpcache.py
+"""
+Persistent response cache with conditional requests.
+Pages are kept in a ResponseArchive under RESPONSE_CACHE_DIR together with
+their validators and a hash of their content. Revalidated (304) and
+content-identical pages reach the spider flagged "unchanged", so it can
+skip extracting and publishing them. Pages are only stored once their posts
+were published, a page whose posts were lost is never taken as unchanged.
+"""
+import hashlib
+import logging
+from lxml import etree
+from scrapy.exceptions import NotConfigured
+from scrapy.http import Headers, TextResponse
+
+from scraper.archive import ResponseArchive, SKIPPED_HEADERS, archived_headers, archived_response
+from scraper.metrics import PAGES_UNCHANGED
+
+# Decoded bodies are cached, their transfer headers no longer apply
+CACHE_SKIPPED_HEADERS = SKIPPED_HEADERS | {b"content-encoding", b"content-length", b"transfer-encoding"}
+
+logger = logging.getLogger(__name__)
+
+
+def validators(headers):
+    """``(ETag, Last-Modified)`` of archived headers, header names are case-insensitive"""
+    headers = Headers(headers, encoding="latin-1")
+    return headers.get("ETag"), headers.get("Last-Modified")
+
+
+class ResponseCacheMiddleware:
+    """
+    Downloader middleware sending If-None-Match / If-Modified-Since for cached
+    pages. Servers without validators are handled by comparing a hash of the
+    nodes matched by RESPONSE_CACHE_CONTENT_XPATH (the whole body if unset or
+    nothing matches), which ignores volatile page chrome such as online user lists.
+    Placed after HttpCompressionMiddleware, so it caches and hashes decoded bodies.
+    With a ``spider.publish_tracker`` entries are written once the page's posts
+    were published by TaskPublishPipeline.
+    """
+
+    def __init__(self, cache, content_xpath, stats, crawler=None):
+        self.cache = cache
+        self.content_xpath = etree.XPath(content_xpath) if content_xpath else None
+        self.stats = stats
+        self.crawler = crawler
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not settings.getbool("RESPONSE_CACHE_ENABLED"):
+            raise NotConfigured
+        return cls(
+            ResponseArchive(settings.get("RESPONSE_CACHE_DIR", "http_cache")),
+            settings.get("RESPONSE_CACHE_CONTENT_XPATH"),
+            crawler.stats,
+            crawler,
+        )
+
+    def content_hash(self, response):
+        digest = hashlib.sha1()
+        nodes = []
+        if self.content_xpath is not None and isinstance(response, TextResponse):
+            # Reuses the tree the spider parses, so pages are still parsed once
+            nodes = self.content_xpath(response.selector.root)
+        if nodes:
+            for node in nodes:
+                digest.update(etree.tostring(node, with_tail=False) if isinstance(node, etree._Element) else str(node).encode("utf-8"))
+        else:
+            digest.update(response.body)
+        return digest.hexdigest()
+
+    def process_request(self, request, spider=None):
+        if request.method != "GET":
+            return None
+        try:
+            entry = self.cache.load(request.method, request.url)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable cache entry for {request.url}: {str(e)}")
+            return None
+        if entry is None:
+            return None
+        etag, last_modified = validators(entry[0]["headers"])
+        if etag:
+            request.headers.setdefault("If-None-Match", etag)
+        if last_modified:
+            request.headers.setdefault("If-Modified-Since", last_modified)
+        return None
+
+    def process_response(self, request, response, spider=None):
+        if request.method != "GET":
+            return response
+
+        if response.status == 304:
+            entry = self.cache.load(request.method, request.url)
+            if entry is None:
+                # Only possible if the entry was removed in between, fetch it again
+                request.headers.pop("If-None-Match", None)
+                request.headers.pop("If-Modified-Since", None)
+                return request.replace(dont_filter=True)
+            PAGES_UNCHANGED.labels(reason="revalidated").inc()
+            self.stats.inc_value("response_cache/revalidated")
+            return archived_response(request, *entry, flags=["cached", "unchanged"])
+
+        if response.status != 200:
+            return response
+
+        try:
+            entry = self.cache.load(request.method, request.url)
+            content_hash = self.content_hash(response)
+            headers = archived_headers(response, CACHE_SKIPPED_HEADERS)
+            if entry is not None and entry[0].get("content_hash") == content_hash:
+                response.flags.append("unchanged")
+                PAGES_UNCHANGED.labels(reason="content_hash").inc()
+                self.stats.inc_value("response_cache/unchanged")
+                if validators(entry[0]["headers"]) == validators(headers):
+                    return response
+        except (OSError, ValueError) as e:
+            logger.error(f"Error caching {request.url}: {str(e)}")
+            return response
+
+        def store():
+            try:
+                self.cache.save(request.method, request.url, response.status, headers, response.body,
+                                extra={"content_hash": content_hash})
+                self.stats.inc_value("response_cache/stored")
+            except (OSError, ValueError) as e:
+                logger.error(f"Error caching {request.url}: {str(e)}")
+
+        tracker = getattr(spider or getattr(self.crawler, "spider", None), "publish_tracker", None)
+        if tracker is not None:
+            tracker.when_published(request, store)
+        else:
+            store()
+        return response
@@ -0,0 +1,33 @@
+# scraper/identity.py
+import hashlib
+from datetime import datetime
+from urllib.parse import urlparse, parse_qs, urlencode
+
+from inference_service.utils.text import normalize_text
+
+
+def topic_url(post_url):
+    """
+    Strip pagination from a topic URL so a post keeps its identity
+    when it moves to another page of the topic.
+    """
+    parsed = urlparse(post_url or "")
+    query = {key: value for key, value in parse_qs(parsed.query).items() if key != "start"}
+    path = parsed.path.split("&start=")[0]
+    return parsed._replace(path=path, query=urlencode(query, doseq=True)).geturl()
+
+
+def post_hash(post_data):
+    """
+    Stable identity of a scraped post: SHA-256 of its topic URL, author, date and text.
+    """
+    date = post_data.get("date")
+    if isinstance(date, datetime):
+        date = date.strftime("%Y-%m-%d, %H:%M")
+    parts = [
+        topic_url(post_data.get("post_url")),
+        (post_data.get("username") or "").strip(),
+        date or "",
+        normalize_text(post_data.get("review") or ""),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
@@ -0,0 +1,57 @@
+# scraper/jobs.py
+"""
+Crawl job queue of the crawler daemon (scraper.daemon), kept in Redis.
+Only depends on redis, so Celery tasks can submit jobs without importing Scrapy.
+"""
+import os
+import json
+from datetime import datetime
+import redis
+
+# Redis holding crawl state shared between processes: the job queue, and the
+# seen-set and rate limit of sharded crawls (scraper.sharding)
+CRAWL_REDIS_URL = os.getenv("CRAWL_REDIS_URL", "redis://redis:6379/2")
+
+CRAWL_JOBS_KEY = "crawl:jobs"
+
+# Job statuses are kept for a day after their last update
+JOB_STATUS_TTL = 24 * 3600
+
+CRAWL_MODES = ("full", "incremental")
+
+
+def get_redis(redis_url=CRAWL_REDIS_URL):
+    return redis.Redis.from_url(redis_url)
+
+
+def job_status_key(job_id):
+    return f"crawl:job:{job_id}"
+
+
+def set_job_status(client, job_id, status, **fields):
+    key = job_status_key(job_id)
+    client.hset(key, mapping={"status": status, "updated_at": datetime.now().isoformat(), **fields})
+    client.expire(key, JOB_STATUS_TTL)
+
+
+def get_job_status(job_id, client=None):
+    client = client or get_redis()
+    return {key.decode(): value.decode() for key, value in client.hgetall(job_status_key(job_id)).items()}
+
+
+def submit_crawl_job(mode="incremental", forum_url=None, job_id=None, client=None):
+    """
+    Queue a crawl for the daemon and return its job id.
+    The job id also names the crawl frontier, so a job submitted again under
+    the same id resumes where an interrupted run of it stopped.
+    """
+    if mode not in CRAWL_MODES:
+        raise ValueError(f"Unknown crawl mode {mode}, expected one of {CRAWL_MODES}")
+    if job_id is None:
+        job_id = f"polwro-{mode}" if forum_url is None else f"polwro-{mode}:{forum_url.rsplit('=', 1)[-1]}"
+
+    client = client or get_redis()
+    job = {"job_id": job_id, "mode": mode, "forum_url": forum_url, "attempt": 0}
+    set_job_status(client, job_id, "queued", mode=mode)
+    client.rpush(CRAWL_JOBS_KEY, json.dumps(job))
+    return job_id
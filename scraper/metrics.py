@@ -1,4 +1,4 @@
-from prometheus_client import Summary, Counter, Histogram
+from prometheus_client import Summary, Counter, Gauge, Histogram
 
 FORUM_SCRAPE_TIME = Summary(
     'polwro_forum_scrape_seconds',
@@ -43,6 +43,11 @@ VOTE_RATE_HISTOGRAM = Histogram(
     buckets=[-100, -50, -20, -10, -5, -1, 0, 1, 5, 10, 20, 50, 100],
 )
 
+TOPICS_SKIPPED = Counter(
+    'polwro_topics_skipped_total',
+    'Number of topics skipped by incremental crawls because their listing entry did not change'
+)
+
 # Course metrics
 COURSES_SCRAPED = Counter(
     'polwro_courses_total',
@@ -67,3 +72,118 @@ LANGUAGE_DETECTION_TIME = Histogram(
     'Time spent on language detection',
     buckets=[.005, .01, .025, .05, .075, .1, .25, .5, .75, 1.0]
 )
+
+# Vectorization metrics
+VECTORIZER_BATCH_SIZE_HISTOGRAM = Histogram(
+    'text_vectorizer_batch_size',
+    'Number of reviews vectorized per batch',
+    buckets=[1, 2, 4, 8, 16, 32, 64, 128, 256]
+)
+
+VECTORIZER_BATCH_TIME_HISTOGRAM = Histogram(
+    'text_vectorizer_batch_seconds',
+    'Time spent vectorizing a batch of reviews',
+    buckets=[.05, .1, .25, .5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0]
+)
+
+# MongoDB writer metrics
+MONGO_FLUSH_SIZE = Histogram(
+    'mongo_flush_documents',
+    'Number of reviews written per MongoDB flush',
+    buckets=[1, 10, 50, 100, 250, 500, 1000, 2500]
+)
+
+MONGO_FLUSH_TIME = Histogram(
+    'mongo_flush_seconds',
+    'Time spent writing a batch of reviews to MongoDB',
+    buckets=[.005, .01, .025, .05, .1, .25, .5, 1.0, 2.5, 5.0]
+)
+
+MONGO_REQUEUED = Counter(
+    'mongo_requeued_total',
+    'Number of reviews queued again after a failed MongoDB write'
+)
+
+MONGO_DEAD_LETTERED = Counter(
+    'mongo_dead_lettered_total',
+    'Number of reviews moved to the dead-letter collection after repeated failed writes'
+)
+
+DUPLICATE_POSTS = Counter(
+    'duplicate_posts_total',
+    'Number of already stored posts dropped before processing',
+    ['stage']
+)
+
+# Task publisher metrics
+POSTS_PUBLISHED = Counter(
+    'polwro_posts_published_total',
+    'Number of scraped posts published to Celery'
+)
+
+POSTS_PUBLISH_ERRORS = Counter(
+    'polwro_posts_publish_errors_total',
+    'Number of scraped posts that failed to publish to Celery'
+)
+
+PUBLISH_QUEUE_SIZE = Gauge(
+    'polwro_publish_queue_chunks',
+    'Number of post chunks waiting for the background task publisher'
+)
+
+PAGES_UNCHANGED = Counter(
+    'polwro_pages_unchanged_total',
+    'Number of fetched pages that did not change since the previous crawl',
+    ['reason']
+)
+
+# Adaptive concurrency metrics
+CRAWL_CONCURRENCY = Gauge(
+    'polwro_crawl_concurrency',
+    'Concurrent requests per download slot chosen by the adaptive controller'
+)
+
+CRAWL_DELAY = Gauge(
+    'polwro_crawl_delay_seconds',
+    'Delay between requests per download slot chosen by the adaptive controller'
+)
+
+CRAWL_LATENCY = Gauge(
+    'polwro_crawl_latency_seconds',
+    'Median download latency over the last control interval'
+)
+
+CRAWL_LATENCY_BASELINE = Gauge(
+    'polwro_crawl_latency_baseline_seconds',
+    'Lowest median download latency seen by the adaptive controller'
+)
+
+CRAWL_ERROR_RATE = Gauge(
+    'polwro_crawl_error_rate',
+    'Share of 429, 5xx and failed downloads over the last control interval'
+)
+
+CRAWL_REQUEST_RATE = Gauge(
+    'polwro_crawl_request_rate',
+    'Downloads per second over the last control interval'
+)
+
+CRAWL_THROTTLE_DECISIONS = Counter(
+    'polwro_crawl_throttle_decisions_total',
+    'Adaptive concurrency control steps',
+    ['action']
+)
+
+# Crawler daemon metrics
+CRAWL_JOBS = Counter(
+    'polwro_crawl_jobs_total',
+    'Crawl jobs run by the crawler daemon',
+    ['mode', 'result']
+)
+
+CRAWL_JOB_TIME = Histogram(
+    'polwro_crawl_job_seconds',
+    'Duration of crawl jobs run by the crawler daemon',
+    ['mode'],
+    buckets=[10, 30, 60, 300, 600, 1800, 3600, 7200, 14400]
+)
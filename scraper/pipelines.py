@@ -0,0 +1,236 @@
+# scraper/pipelines.py
+import os
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from twisted.internet import defer, task
+from twisted.internet.threads import deferToThread
+
+from scraper.metrics import POSTS_PUBLISHED, POSTS_PUBLISH_ERRORS, PUBLISH_QUEUE_SIZE
+
+# "fused" sends posts to the in-process process_posts pipeline,
+# "distributed" to the detect_language -> text_vectorizer -> save_to_mongo chain
+PIPELINE_MODE = os.getenv("PIPELINE_MODE", "fused")
+
+logger = logging.getLogger(__name__)
+
+
+class PublishTracker:
+    """
+    Follows the items of each response through TaskPublishPipeline.
+    Callbacks registered for a response, such as marking its page done in the
+    crawl frontier, run once the response has been parsed and all of its items
+    were published. If one of them fails to publish the callbacks are dropped,
+    so the page is crawled again. Only used from the reactor thread.
+    """
+
+    def __init__(self):
+        # Keyed by the request of the response
+        self.responses = {}
+        # id() of items on their way to the pipeline -> request of their response
+        self.items = {}
+
+    def _entry(self, request):
+        return self.responses.setdefault(request, {"items": 0, "parsed": False, "failed": False, "callbacks": []})
+
+    def when_published(self, request, callback):
+        self._entry(request)["callbacks"].append(callback)
+
+    def add_item(self, request, item):
+        self._entry(request)["items"] += 1
+        self.items[id(item)] = request
+
+    def take(self, item):
+        """Request of the response ``item`` came from, once it reaches the pipeline"""
+        return self.items.pop(id(item), None)
+
+    def parsed(self, request):
+        """No more items will come from the response to ``request``"""
+        self._entry(request)["parsed"] = True
+        self._settle(request)
+
+    def discard(self, request):
+        """Forget a response whose callback failed, without running its callbacks"""
+        self.responses.pop(request, None)
+
+    def published(self, requests):
+        for request in requests:
+            if request in self.responses:
+                self.responses[request]["items"] -= 1
+                self._settle(request)
+
+    def failed(self, requests):
+        for request in requests:
+            if request in self.responses:
+                self.responses[request]["failed"] = True
+                self._settle(request)
+
+    def _settle(self, request):
+        entry = self.responses[request]
+        if not entry["parsed"] or (entry["items"] > 0 and not entry["failed"]):
+            return
+        del self.responses[request]
+        if entry["failed"]:
+            return
+        for callback in entry["callbacks"]:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in publish callback for {request.url}: {str(e)}")
+
+
+class TaskPublishPipeline:
+    """
+    Buffer scraped posts and publish them to Celery from a background thread.
+
+    Posts are flushed in chunks of TASK_PUBLISH_BATCH_SIZE, or after
+    TASK_PUBLISH_FLUSH_INTERVAL seconds. The publisher queue holds at most
+    TASK_PUBLISH_QUEUE_SIZE chunks. When it is full, the chunk waits on the
+    reactor and process_item returns a Deferred that fires once the publisher
+    has taken it, so Scrapy slows down instead of the reactor (or a threadpool
+    thread per chunk) blocking on a slow broker. Published items are
+    reported to the spider's ``publish_tracker``, if it has one.
+    """
+
+    def __init__(self, app, batch_size=50, flush_interval=2.0, queue_size=20, mode=PIPELINE_MODE):
+        self.app = app
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = float(flush_interval)
+        self.mode = mode
+
+        self.buffer = []
+        # Request of the response each buffered post came from, for the publish tracker
+        self.sources = []
+        self.tracker = None
+        self.last_flush = time.monotonic()
+        self.chunks = queue.Queue(maxsize=max(1, int(queue_size)))
+        # (chunk, Deferred) held back while the publisher queue is full, reactor thread only
+        self.waiting = deque()
+        self.publisher = None
+        self.flush_loop = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        from scraper.polwro_scraper import app
+
+        settings = crawler.settings
+        return cls(
+            app,
+            batch_size=settings.getint("TASK_PUBLISH_BATCH_SIZE", 50),
+            flush_interval=settings.getfloat("TASK_PUBLISH_FLUSH_INTERVAL", 2.0),
+            queue_size=settings.getint("TASK_PUBLISH_QUEUE_SIZE", 20),
+            mode=settings.get("PIPELINE_MODE", PIPELINE_MODE),
+        )
+
+    def open_spider(self, spider):
+        self.tracker = getattr(spider, "publish_tracker", None)
+        self.publisher = threading.Thread(target=self._publish_loop, name="task-publisher", daemon=True)
+        self.publisher.start()
+        self.flush_loop = task.LoopingCall(self._flush_if_stale)
+        self.flush_loop.start(self.flush_interval, now=False)
+
+    def process_item(self, item, spider):
+        self.buffer.append(dict(item))
+        self.sources.append(self.tracker.take(item) if self.tracker is not None else None)
+        if len(self.buffer) >= self.batch_size:
+            return self._flush(item)
+        return item
+
+    def close_spider(self, spider):
+        if self.flush_loop and self.flush_loop.running:
+            self.flush_loop.stop()
+        # Held back chunks go before the last one, in the order they were flushed
+        chunks = [chunk for chunk, _ in self.waiting] + [self._take_chunk()]
+        waiting, self.waiting = self.waiting, deque()
+        for _, deferred in waiting:
+            deferred.callback(None)
+        # Drain the publisher off the reactor thread so pending chunks are not lost
+        return deferToThread(self._stop, chunks)
+
+    def _take_chunk(self):
+        """Buffered posts with the requests they came from, or None if empty"""
+        if not self.buffer:
+            return None
+        chunk = (self.buffer, self.sources)
+        self.buffer, self.sources = [], []
+        return chunk
+
+    def _flush(self, item=None):
+        chunk = self._take_chunk()
+        self.last_flush = time.monotonic()
+        if chunk is None:
+            return item
+        # Chunks already waiting go first, posts are published in order
+        if not self.waiting:
+            try:
+                self.chunks.put_nowait(chunk)
+                return item
+            except queue.Full:
+                pass
+            finally:
+                PUBLISH_QUEUE_SIZE.set(self.chunks.qsize())
+
+        # Backpressure: hold this item until the publisher has room
+        logger.warning("Task publisher queue full, waiting for the broker")
+        deferred = defer.Deferred()
+        self.waiting.append((chunk, deferred))
+        deferred.addCallback(lambda _: item)
+        return deferred
+
+    def _admit_waiting(self):
+        """Move held back chunks into the publisher queue as it frees up"""
+        while self.waiting:
+            try:
+                self.chunks.put_nowait(self.waiting[0][0])
+            except queue.Full:
+                break
+            _, deferred = self.waiting.popleft()
+            deferred.callback(None)
+        PUBLISH_QUEUE_SIZE.set(self.chunks.qsize())
+
+    def _flush_if_stale(self):
+        if self.buffer and time.monotonic() - self.last_flush >= self.flush_interval:
+            self._flush()
+
+    def _stop(self, chunks):
+        for chunk in chunks:
+            if chunk:
+                self.chunks.put(chunk)
+        self.chunks.put(None)
+        self.publisher.join()
+
+    def _publish_loop(self):
+        # Imported here so importing the pipeline does not install the default reactor
+        from twisted.internet import reactor
+
+        while True:
+            chunk = self.chunks.get()
+            PUBLISH_QUEUE_SIZE.set(self.chunks.qsize())
+            if chunk is None:
+                break
+            reactor.callFromThread(self._admit_waiting)
+            posts, sources = chunk
+            published = self._publish(posts)
+            if self.tracker is not None:
+                reactor.callFromThread(self.tracker.failed, sources[published:])
+                reactor.callFromThread(self.tracker.published, sources[:published])
+
+    def _publish(self, chunk):
+        """Send ``chunk`` to Celery and return how many of its posts were published"""
+        published = 0
+        try:
+            if self.mode == "fused":
+                self.app.send_task("process_posts", args=[chunk])
+                published = len(chunk)
+            else:
+                for post_data in chunk:
+                    self.app.send_task("detect_language", args=[post_data])
+                    published += 1
+        except Exception as e:
+            POSTS_PUBLISH_ERRORS.inc(len(chunk) - published)
+            logger.error(f"Failed to publish {len(chunk) - published} posts: {str(e)}")
+        finally:
+            POSTS_PUBLISHED.inc(published)
+        return published
@@ -0,0 +1,115 @@
+# scraper/sharding.py
+"""
+Shared state for sharded crawls: every forum is crawled by its own task,
+all shards reuse one login session, claim topics in a shared seen-set and
+draw requests from one cross-shard rate limit.
+"""
+import logging
+from datetime import datetime
+import redis
+from scrapy.exceptions import NotConfigured
+from scrapy.utils.defer import maybe_deferred_to_future
+from urllib.parse import urlparse
+from twisted.internet.task import deferLater
+
+from scraper.jobs import CRAWL_REDIS_URL
+from scraper.mongo import get_database
+
+# Seen-sets of old runs expire on their own
+SEEN_TTL = 2 * 24 * 3600
+
+# Reserve the next free request slot on the shared (Redis) clock and
+# return how many seconds the caller has to wait for it
+_RESERVE_SLOT = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local interval = tonumber(ARGV[1])
+local slot = tonumber(redis.call('GET', KEYS[1]) or '0')
+if slot < now then slot = now end
+redis.call('SET', KEYS[1], tostring(slot + interval), 'EX', 3600)
+return tostring(slot - now)
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def parse_cookie_header(header):
+    """Turn a ``Cookie`` request header into a dict"""
+    if isinstance(header, bytes):
+        header = header.decode("latin-1")
+    cookies = {}
+    for part in (header or "").split(";"):
+        name, _, value = part.strip().partition("=")
+        if name:
+            cookies[name] = value
+    return cookies
+
+
+def save_crawl_plan(run_id, forum_urls, cookies):
+    """Store the forums to crawl and the shared session of a sharded run"""
+    get_database()["scraping_metadata"].update_one(
+        {"_id": f"crawl_plan:{run_id}"},
+        {"$set": {"forums": forum_urls, "cookies": cookies, "created_at": datetime.now()}},
+        upsert=True,
+    )
+
+
+def load_crawl_plan(run_id):
+    return get_database()["scraping_metadata"].find_one({"_id": f"crawl_plan:{run_id}"}) or {}
+
+
+class SharedSeenSet:
+    """Topic URLs claimed by any shard of one run, kept in a Redis set"""
+
+    def __init__(self, run_id, redis_url=CRAWL_REDIS_URL):
+        self.key = f"crawl:seen:{run_id}"
+        self.redis = redis.Redis.from_url(redis_url)
+
+    def claim(self, url):
+        """True if this shard is the first to claim ``url``"""
+        try:
+            pipe = self.redis.pipeline()
+            pipe.sadd(self.key, url)
+            pipe.expire(self.key, SEEN_TTL)
+            added, _ = pipe.execute()
+        except Exception as e:
+            # Overlap is harmless (posts are deduplicated), losing topics is not
+            logger.warning(f"Shared seen-set unavailable, crawling {url}: {str(e)}")
+            return True
+        return bool(added)
+
+
+class SharedRateLimitMiddleware:
+    """
+    Downloader middleware enforcing CRAWL_RATE_LIMIT requests per second
+    across every crawler process sharing CRAWL_REDIS_URL.
+    Requests are delayed without blocking the reactor.
+    """
+
+    def __init__(self, redis_url, rate_limit):
+        self.interval = 1.0 / rate_limit
+        self.redis = redis.Redis.from_url(redis_url)
+        self.reserve_slot = self.redis.register_script(_RESERVE_SLOT)
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        rate_limit = crawler.settings.getfloat("CRAWL_RATE_LIMIT", 0)
+        if rate_limit <= 0:
+            raise NotConfigured
+        return cls(crawler.settings.get("CRAWL_REDIS_URL", CRAWL_REDIS_URL), rate_limit)
+
+    async def process_request(self, request, spider=None):
+        try:
+            key = f"crawl:ratelimit:{urlparse(request.url).netloc}"
+            wait = float(self.reserve_slot(keys=[key], args=[self.interval]))
+        except Exception as e:
+            # Fall back to the local DOWNLOAD_DELAY rather than stopping the crawl
+            logger.warning(f"Shared rate limit unavailable: {str(e)}")
+            return None
+        if wait <= 0:
+            return None
+        # Imported here so Scrapy can install its own reactor first
+        from twisted.internet import reactor
+
+        await maybe_deferred_to_future(deferLater(reactor, wait, lambda: None))
+        return None
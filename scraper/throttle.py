@@ -0,0 +1,176 @@
+# scraper/throttle.py
+"""
+Adaptive crawl concurrency.
+Unlike AutoThrottle, which only follows latency, the controller separates
+a slow site from an overloaded one: it backs off on 429s, on 5xx and
+download errors, and on latency rising above the crawl's own baseline,
+and otherwise speeds up until the ADAPTIVE_MAX_RATE politeness ceiling.
+"""
+import logging
+import statistics
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+from twisted.internet import task
+
+from scraper.metrics import (
+    CRAWL_CONCURRENCY, CRAWL_DELAY, CRAWL_LATENCY, CRAWL_LATENCY_BASELINE,
+    CRAWL_ERROR_RATE, CRAWL_REQUEST_RATE, CRAWL_THROTTLE_DECISIONS
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrency:
+    """
+    Scrapy extension adjusting the concurrency and delay of every download
+    slot once per ADAPTIVE_INTERVAL seconds:
+
+    - any 429, or more errors than ADAPTIVE_MAX_ERROR_RATE: halve the
+      concurrency and double the delay (at least to the Retry-After value)
+    - median latency above ADAPTIVE_LATENCY_TOLERANCE times the baseline
+      (the lowest median seen so far): one slot less, 25% more delay; if
+      that did not bring the latency down, the slower latency becomes the
+      new baseline
+    - otherwise: shorten the delay down to 1 / ADAPTIVE_MAX_RATE and add one
+      slot at a time up to ADAPTIVE_MAX_CONCURRENCY while responses are slower
+      than the delay
+    """
+
+    def __init__(self, crawler):
+        settings = crawler.settings
+        if not settings.getbool("ADAPTIVE_CONCURRENCY_ENABLED"):
+            raise NotConfigured
+        max_rate = settings.getfloat("ADAPTIVE_MAX_RATE", 2.0)
+        if max_rate <= 0:
+            raise NotConfigured("ADAPTIVE_MAX_RATE must be higher than 0")
+
+        self.crawler = crawler
+        self.interval = settings.getfloat("ADAPTIVE_INTERVAL", 5.0)
+        self.min_delay = 1.0 / max_rate
+        self.max_delay = settings.getfloat("ADAPTIVE_MAX_DELAY", 30.0)
+        self.min_concurrency = max(1, settings.getint("ADAPTIVE_MIN_CONCURRENCY", 1))
+        self.max_concurrency = max(
+            self.min_concurrency,
+            settings.getint("ADAPTIVE_MAX_CONCURRENCY", settings.getint("CONCURRENT_REQUESTS_PER_DOMAIN", 8)),
+        )
+        self.max_error_rate = settings.getfloat("ADAPTIVE_MAX_ERROR_RATE", 0.05)
+        self.latency_tolerance = settings.getfloat("ADAPTIVE_LATENCY_TOLERANCE", 2.0)
+
+        # Start cautiously: one slot at the configured delay, never faster than the ceiling
+        self.concurrency = self.min_concurrency
+        self.delay = min(max(settings.getfloat("DOWNLOAD_DELAY"), self.min_delay), self.max_delay)
+        self.baseline = None
+        self.last_action = None
+        self.last_latency = None
+        self.loop = None
+        self._reset_window()
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        extension = cls(crawler)
+        crawler.signals.connect(extension.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(extension.spider_closed, signal=signals.spider_closed)
+        crawler.signals.connect(extension.response_downloaded, signal=signals.response_downloaded)
+        return extension
+
+    def _reset_window(self):
+        self.latencies = []
+        self.responses = 0
+        self.server_errors = 0
+        self.throttled = 0
+        self.retry_after = 0.0
+        self.exceptions = self.crawler.stats.get_value("downloader/exception_count", 0)
+
+    def spider_opened(self, spider):
+        self._export()
+        self.loop = task.LoopingCall(self.adjust)
+        self.loop.start(self.interval, now=False)
+
+    def spider_closed(self, spider):
+        if self.loop and self.loop.running:
+            self.loop.stop()
+
+    def response_downloaded(self, response, request, spider):
+        self.responses += 1
+        latency = request.meta.get("download_latency")
+        # Error pages are typically fast, they would drag the baseline down
+        if latency is not None and response.status < 400:
+            self.latencies.append(latency)
+        if response.status == 429:
+            self.throttled += 1
+            retry_after = response.headers.get("Retry-After", b"").decode("latin-1")
+            if retry_after.isdigit():
+                self.retry_after = max(self.retry_after, float(retry_after))
+        elif response.status >= 500:
+            self.server_errors += 1
+        self._apply(self.crawler.engine.downloader.slots.get(request.meta.get("download_slot")))
+
+    def adjust(self):
+        """One control step over the responses of the last interval"""
+        exceptions = self.crawler.stats.get_value("downloader/exception_count", 0) - self.exceptions
+        requests = self.responses + exceptions
+        if not requests:
+            self._reset_window()
+            return
+
+        error_rate = (self.server_errors + self.throttled + exceptions) / requests
+        latency = statistics.median(self.latencies) if self.latencies else None
+        if latency is not None:
+            # The baseline follows the fastest the site has been, drifting up
+            # slowly so a section of heavier pages does not look like overload
+            self.baseline = latency if self.baseline is None else min(latency, self.baseline * 1.05)
+
+        if self.throttled or error_rate > self.max_error_rate:
+            action = "backoff_throttled" if self.throttled else "backoff_errors"
+            self.concurrency = max(self.min_concurrency, self.concurrency // 2)
+            self.delay = min(self.max_delay, max(self.delay * 2, self.retry_after))
+        elif latency is not None and latency > self.latency_tolerance * self.baseline:
+            if self.last_action == "backoff_latency" and latency >= 0.9 * self.last_latency:
+                # Backing off did not help, the pages are slow rather than the server overloaded
+                action = "rebaseline"
+                self.baseline = latency
+            else:
+                action = "backoff_latency"
+                self.concurrency = max(self.min_concurrency, self.concurrency - 1)
+                self.delay = min(self.max_delay, self.delay * 1.25)
+        elif self.delay > self.min_delay or self.concurrency < self.max_concurrency:
+            action = "increase"
+            # Extra slots only help once responses take longer than the delay
+            if self.concurrency < self.max_concurrency and (self.delay <= self.min_delay or (latency or 0) > self.delay):
+                self.concurrency += 1
+            self.delay = max(self.min_delay, self.delay * 0.8)
+        else:
+            action = "hold"
+
+        self.last_action, self.last_latency = action, latency
+        CRAWL_THROTTLE_DECISIONS.labels(action=action).inc()
+        CRAWL_ERROR_RATE.set(error_rate)
+        CRAWL_REQUEST_RATE.set(requests / self.interval)
+        if latency is not None:
+            CRAWL_LATENCY.set(latency)
+            CRAWL_LATENCY_BASELINE.set(self.baseline)
+        logger.info(
+            f"Adaptive concurrency {action}: concurrency {self.concurrency}, delay {self.delay:.2f}s "
+            f"({requests} requests, error rate {error_rate:.2f}, median latency {latency})"
+        )
+
+        # Slots opened later are adjusted on their first response
+        for slot in self.crawler.engine.downloader.slots.values():
+            self._apply(slot)
+        self._export()
+        self._reset_window()
+
+    def _apply(self, slot):
+        if slot is not None:
+            slot.concurrency = self.concurrency
+            slot.delay = self.delay
+            # The default ±50% jitter would let requests through faster than ADAPTIVE_MAX_RATE
+            if hasattr(slot, "jitter"):
+                slot.jitter = 0
+            else:
+                # Scrapy < 2.19
+                slot.randomize_delay = False
+
+    def _export(self):
+        CRAWL_CONCURRENCY.set(self.concurrency)
+        CRAWL_DELAY.set(self.delay)
@@ -5,12 +5,24 @@ from transformers import AutoTokenizer, AutoModel
 import logging
 from pyspark.ml.linalg import Vectors
 from pyspark.sql.types import StructType, StructField, ArrayType, FloatType
+import os
+from inference_service.utils.embedding_cache import EmbeddingCache, cache_revision
 
 # Start Spark session
 spark = SparkSession.builder.appName("ModelInference").getOrCreate()
 
-tokenizer = AutoTokenizer.from_pretrained("allegro/herbert-base-cased")
-bert_model = AutoModel.from_pretrained("allegro/herbert-base-cased")
+BERT_MODEL_REVISION = os.getenv("BERT_MODEL_REVISION", "main")
+
+tokenizer = AutoTokenizer.from_pretrained("allegro/herbert-base-cased", revision=BERT_MODEL_REVISION)
+bert_model = AutoModel.from_pretrained("allegro/herbert-base-cased", revision=BERT_MODEL_REVISION)
+
+# Reuse embeddings computed by the workers / inference server when Redis is configured
+embedding_cache = EmbeddingCache(
+    "allegro/herbert-base-cased",
+    # Unquantized torch model, the same entries as the fp32 encoders
+    revision=cache_revision(BERT_MODEL_REVISION, "fp32"),
+    redis_url=os.getenv("EMBEDDING_CACHE_REDIS_URL"),
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,19 +35,24 @@ print("Model loaded successfully.")
 data_text = "Beznadzieja, Odradzam. Zajęcia nudne. Nie warto. Omijać szerokim łukiem. Nie polecam. Kolokwium trudne."
 # data_text = "Bardzo dobry prowadzący, bardzo polecam. Potrafi wytłumaczyć wszystko w prosty sposób. Zajęcia są ciekawe i nie ma mowy o nudzie. Bardzo polecam! :)"
 
-tokens = tokenizer(
-    data_text,
-    return_tensors="pt",
-    truncation=True,
-    padding=True,
-    max_length=512,
-)
 
-# Generate vector embeddings using HerBERT
-with torch.no_grad():
-    outputs = bert_model(**tokens)
-    # Use the [CLS] token representation as the vector
-    data_vector = outputs.last_hidden_state[:, 0, :].squeeze().tolist()
+def encode_texts(texts):
+    tokens = tokenizer(
+        texts,
+        return_tensors="pt",
+        truncation=True,
+        padding=True,
+        max_length=512,
+    )
+
+    # Generate vector embeddings using HerBERT
+    with torch.no_grad():
+        outputs = bert_model(**tokens)
+        # Use the [CLS] token representation as the vector
+        return outputs.last_hidden_state[:, 0, :].numpy()
+
+
+data_vector = embedding_cache.get_or_compute([data_text], encode_texts)[0].tolist()
 
 # Create a DataFrame with the vector
 data_list = [(Vectors.dense(data_vector),)]
@@ -1,4 +1,6 @@
+import base64
 import shutil
+import numpy as np
 from pyspark.sql import SparkSession, DataFrame
 from pyspark.ml.feature import VectorAssembler, StringIndexer
 from pyspark.ml.classification import RandomForestClassifier
@@ -8,7 +10,10 @@ from pyspark.ml.tuning import ParamGridBuilder, TrainValidationSplit
 from pyspark.sql.functions import col, udf
 from pyspark.ml.linalg import Vectors, VectorUDT
 import os
+from datetime import datetime
 from pathlib import Path
+from inference_service.server.model_registry import ModelRegistry, SPARK_MODEL_DIR, TREE_ENSEMBLE_FILE
+from inference_service.server.tree_ensemble import export_pipeline_model
 
 def create_spark_session():
     spark_master_url = os.getenv("SPARK_MASTER_URL", "spark://localhost:7077")
@@ -28,12 +33,13 @@ def load_data_from_csv(spark, file_path):
     )
 
 def prepare_features(df: DataFrame) -> DataFrame:
-    # Convert string of space-separated numbers to vector
+    # Convert the exported vector column, base64 float32 bytes or space-separated numbers
     def string_to_vector(vec_str):
         try:
-            # Split string by whitespace and convert to float array
-            vec_list = [float(x) for x in vec_str.split()]
-            return Vectors.dense(vec_list)
+            if ' ' in vec_str:
+                # Split string by whitespace and convert to float array
+                return Vectors.dense([float(x) for x in vec_str.split()])
+            return Vectors.dense(np.frombuffer(base64.b64decode(vec_str), dtype="<f4"))
         except:
             return None
     
@@ -117,6 +123,18 @@ def evaluate_model(model, test_data):
 
     return predictions
 
+def publish_to_registry(model_path, ensemble, registry_dir):
+    """Copy a saved model and its NumPy export into a new registry version and make it current"""
+    version = datetime.now().strftime("%Y%m%d%H%M%S")
+    # Stage in a hidden directory first, registry readers skip dot-prefixed names
+    staging_path = os.path.join(registry_dir, f".{version}")
+    shutil.copytree(model_path, os.path.join(staging_path, SPARK_MODEL_DIR))
+    ensemble.save(os.path.join(staging_path, TREE_ENSEMBLE_FILE))
+    os.rename(staging_path, os.path.join(registry_dir, version))
+
+    ModelRegistry(registry_dir).publish(version)
+    return version
+
 def main():
 
     spark = create_spark_session()
@@ -142,6 +160,14 @@ def main():
     # Save the model
     spark_path = "/opt/bitnami/spark/data/review_classification_model"
     model.bestModel.write().overwrite().save(spark_path)
+    # Array export for CLASSIFIER_BACKEND=numpy, which serves without Spark
+    ensemble = export_pipeline_model(model.bestModel)
+
+    # Publish a new version for hot reload by the inference server
+    registry_dir = os.getenv("MODEL_REGISTRY_DIR")
+    if registry_dir:
+        version = publish_to_registry(spark_path, ensemble, registry_dir)
+        print(f"Model published to registry {registry_dir} as version {version}")
 
     # Move the model to the desired location
     desired_path = "/app/models/review_classification_model"
@@ -150,6 +176,7 @@ def main():
         spark_path,
         desired_path
     )
+    ensemble.save(os.path.join(desired_path, TREE_ENSEMBLE_FILE))
     # Print the model path
     print(f"Model saved to {desired_path}")
 
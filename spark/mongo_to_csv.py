@@ -1,7 +1,10 @@
 import argparse
+import base64
 from pymongo import MongoClient
 import pandas as pd
 
+from inference_service.utils.vector_codec import decode_vector
+
 def get_mongodb_data(host, port, username, password, db_name, collection_name):
     """Connect to MongoDB and retrieve data from specified collection."""
     connection_string = f"mongodb://{username}:{password}@{host}:{port}/"
@@ -13,12 +16,18 @@ def get_mongodb_data(host, port, username, password, db_name, collection_name):
     print(f"Loaded {len(documents)} documents from collection")
     return documents
 
-def save_to_csv(documents, output_path):
+def format_vector(value, vector_format="base64"):
+    """Render a vector for CSV: base64 of float32 bytes, or space separated text."""
+    vector = decode_vector(value).astype("<f4", copy=False)
+    if vector_format == "base64":
+        return base64.b64encode(vector.tobytes()).decode("ascii")
+    return ' '.join(map(str, vector.tolist()))
+
+def save_to_csv(documents, output_path, vector_format="base64"):
     """Convert documents to DataFrame and save to CSV."""
     df = pd.DataFrame(documents)
-    # Convert vector arrays to string with space separator
     if 'vectors' in df.columns:
-        df['vectors'] = df['vectors'].apply(lambda x: ' '.join(map(str, x)))
+        df['vectors'] = df['vectors'].apply(lambda x: format_vector(x, vector_format))
     df.to_csv(output_path, index=False, encoding="utf-8-sig")
     print(f"DataFrame shape: {df.shape}")
     print(f"Data saved to: {output_path}")
@@ -34,6 +43,8 @@ def main():
     parser.add_argument('--collection', default='vectorized_reviews', help='Collection name')
     parser.add_argument('--output', default='spark/data/vectorized_reviews.csv', 
                        help='Output CSV file path')
+    parser.add_argument('--vector-format', default='base64', choices=['base64', 'text'],
+                       help='Vector column encoding: base64 float32 bytes or space separated text')
 
     args = parser.parse_args()
 
@@ -48,7 +59,7 @@ def main():
     )
 
     # Save to CSV
-    df = save_to_csv(documents, args.output)
+    df = save_to_csv(documents, args.output, args.vector_format)
     return df
 
 if __name__ == "__main__":